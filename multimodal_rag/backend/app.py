@@ -1,33 +1,44 @@
 from contextlib import asynccontextmanager
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timedelta
 import shutil
+import hashlib
 import uuid
 import os
 import asyncio
-import json
+import threading
+import time
+import re
+from bisect import bisect_right
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain, filterfalse, islice
+from os.path import basename
+from typing import Optional
 
 # ⚡ Load environment variables FIRST for ultra-fast Gemini API
 from dotenv import load_dotenv
 load_dotenv()  # Loads GEMINI_API_KEY and all other settings
 
-from fastapi import FastAPI, UploadFile, File, HTTPException, Form, WebSocket, WebSocketDisconnect
+from fastapi import FastAPI, UploadFile, File, HTTPException, WebSocket, WebSocketDisconnect, BackgroundTasks
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, StreamingResponse, FileResponse, Response, ORJSONResponse
 from fastapi.requests import Request
 from fastapi.middleware.cors import CORSMiddleware
-from pathlib import Path
-import shutil
-import time
-import uuid
+from fastapi.middleware.gzip import GZipMiddleware
+import anyio.to_thread
+import numpy as np
+import orjson
 
 from backend.config import settings
-from backend.models.document import ProcessedDocument, UploadResponse, Modality
+from backend.models.document import UploadResponse, Modality
 from backend.models.query import QueryRequest, QueryResponse
 from backend.ingestion.text_processor import TextProcessor
 from backend.ingestion.image_processor import ImageProcessor
 from backend.ingestion.audio_processor import AudioProcessor
+from backend.ingestion import worker_pool
 from backend.embeddings.embedding_manager import EmbeddingManager
 from backend.storage.vector_store import VectorStore
 from backend.retrieval.cross_modal_retriever import CrossModalRetriever
@@ -41,11 +52,45 @@ from backend.cloud.cloud_storage import cloud_storage_manager, CloudProvider, Cl
 from backend.web.web_search import web_search_service, search_web
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Configure worker pools and warm models at startup; release them on shutdown."""
+    global cpu_pool
+    
+    # Size the worker pools used to offload blocking processing
+    loop = asyncio.get_running_loop()
+    loop.set_default_executor(ThreadPoolExecutor(max_workers=settings.worker_threads))
+    anyio.to_thread.current_default_thread_limiter().total_tokens = settings.worker_threads
+    
+    if settings.cpu_pool_workers > 0:
+        cpu_pool = ProcessPoolExecutor(
+            max_workers=settings.cpu_pool_workers,
+            initializer=worker_pool.init_worker
+        )
+        logger.logger.info(f"CPU process pool started with {settings.cpu_pool_workers} workers")
+    
+    # Warm embedding models so the first /upload and /query don't pay for it
+    await asyncio.to_thread(embedding_manager.warmup)
+    await asyncio.to_thread(rag_generator.warmup)
+    
+    if settings.watch_on_startup:
+        document_watcher.start()
+    
+    yield
+    
+    document_watcher.stop()
+    if cpu_pool is not None:
+        cpu_pool.shutdown(wait=False, cancel_futures=True)
+    await cloud_storage_manager.close()
+
+
 # Initialize app
 app = FastAPI(
     title="Multimodal RAG System",
     description="Evidence-based multimodal retrieval and generation",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # CORS
@@ -57,6 +102,28 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress large JSON payloads (/dump, /graph, /summarize) only; presentation downloads are
+# already zip-compressed and must keep Content-Length/range support, so they pass through
+_GZIP_PATHS = frozenset({"/dump", "/graph", "/summarize"})
+
+
+class _SelectiveGZipMiddleware:
+    """Apply GZipMiddleware to the listed paths and pass every other request straight through."""
+    
+    def __init__(self, app, paths: frozenset, **gzip_options):
+        self.app = app
+        self.gzip_app = GZipMiddleware(app, **gzip_options)
+        self.paths = paths
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"] in self.paths:
+            await self.gzip_app(scope, receive, send)
+        else:
+            await self.app(scope, receive, send)
+
+
+app.add_middleware(_SelectiveGZipMiddleware, paths=_GZIP_PATHS, minimum_size=1024, compresslevel=6)
+
 # Static files and templates
 app.mount("/static", StaticFiles(directory="frontend/static"), name="static")
 templates = Jinja2Templates(directory="frontend/templates")
@@ -71,7 +138,36 @@ text_processor = TextProcessor()
 image_processor = ImageProcessor()
 audio_processor = AudioProcessor()
 
+# File extension -> (processor, modality) dispatch table
+PROCESSOR_MAP = {ext: (text_processor, Modality.TEXT) for ext in ('pdf', 'docx', 'txt')}
+PROCESSOR_MAP.update({ext: (image_processor, Modality.IMAGE) for ext in ('jpg', 'jpeg', 'png', 'bmp', 'tiff')})
+PROCESSOR_MAP.update({
+    ext: (audio_processor, Modality.AUDIO)
+    for ext in ('mp3', 'wav', 'm4a', 'mp4', 'm4v', 'mpeg', 'mpg', 'avi', 'flac', 'ogg', 'aac')
+})
+
+
+# Optional process pool for CPU-bound document/image/audio processing (disabled when 0 workers)
+cpu_pool: Optional[ProcessPoolExecutor] = None
+CPU_POOL_TASKS = {
+    Modality.TEXT: worker_pool.process_text,
+    Modality.IMAGE: worker_pool.process_image,
+    Modality.AUDIO: worker_pool.process_audio,
+}
+
+
+async def run_processor(processor, modality: Modality, path: Path) -> list:
+    """Run a processor off the event loop - in the CPU pool when enabled, else a thread."""
+    pool_task = CPU_POOL_TASKS.get(modality)
+    if cpu_pool is not None and pool_task is not None:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(cpu_pool, pool_task, path)
+    return await asyncio.to_thread(processor.process_file, path)
+
+
 # ============ WebSocket Connection Manager ============
+BROADCAST_BATCH_SIZE = 50  # Connections sent to concurrently per broadcast batch
+
 class ConnectionManager:
     """Manages WebSocket connections for real-time sync notifications."""
     
@@ -90,12 +186,24 @@ class ConnectionManager:
     
     async def broadcast(self, message: dict):
         """Broadcast message to all connected clients."""
+        # Serialize once (orjson) and fan out concurrently, one batch at a time.
+        # Sent as text frames so browser clients can JSON.parse(event.data) directly.
+        payload = orjson.dumps(message).decode()
+        connections = list(self.active_connections)
         disconnected = []
-        for connection in self.active_connections:
-            try:
-                await connection.send_json(message)
-            except Exception:
-                disconnected.append(connection)
+        
+        for start in range(0, len(connections), BROADCAST_BATCH_SIZE):
+            batch = connections[start:start + BROADCAST_BATCH_SIZE]
+            results = await asyncio.gather(
+                *(connection.send_text(payload) for connection in batch),
+                return_exceptions=True
+            )
+            disconnected.extend(
+                connection for connection, result in zip(batch, results)
+                if isinstance(result, Exception)
+            )
+            # Yield to the event loop between batches
+            await asyncio.sleep(0)
         
         # Clean up disconnected
         for conn in disconnected:
@@ -103,16 +211,89 @@ class ConnectionManager:
 
 ws_manager = ConnectionManager()
 
+# Strong references to in-flight fire-and-forget broadcasts (the loop only keeps weak ones)
+_broadcast_tasks: set = set()
+
+
+def broadcast_in_background(message: dict):
+    """Broadcast to WebSocket clients without making the calling request wait on slow sockets."""
+    task = asyncio.create_task(ws_manager.broadcast(message))
+    _broadcast_tasks.add(task)
+    task.add_done_callback(_broadcast_tasks.discard)
+
 # ============ File Watcher Setup ============
 # Watch the main uploads directory for ALL file changes
 document_watcher = get_document_watcher(watch_path=str(settings.upload_dir))
 
 # Callback for file changes - queues for async processing
-pending_sync_changes: list = []
+# Drained by the /sync/changes polling endpoint; bounded so it can't grow without pollers
+pending_sync_changes: deque = deque(maxlen=10_000)
+pending_paths: set = set()  # Paths present in pending_sync_changes
+_pending_lock = threading.Lock()  # Watcher callbacks write from their own thread
+
+# Changes pushed to WebSocket clients (created lazily on the running event loop)
+broadcast_queue: Optional[asyncio.Queue] = None
+BROADCAST_QUEUE_MAX_SIZE = 1_000  # Oldest changes are dropped beyond this
+_broadcast_loop: Optional[asyncio.AbstractEventLoop] = None
 
 # Auto-index setting - when enabled, automatically index new files
 auto_index_enabled: bool = False
-auto_index_queue: list = []  # Queue of files to auto-index
+auto_index_queue: deque = deque()  # Queue of files to auto-index (FIFO)
+auto_index_set: set = set()  # Paths currently queued; deque entries not in here are stale
+
+def _get_broadcast_queue() -> asyncio.Queue:
+    """Get or create the WebSocket broadcast queue on the running loop."""
+    global broadcast_queue, _broadcast_loop
+    
+    if broadcast_queue is None:
+        broadcast_queue = asyncio.Queue(maxsize=BROADCAST_QUEUE_MAX_SIZE)
+        _broadcast_loop = asyncio.get_running_loop()
+    
+    return broadcast_queue
+
+
+def _put_broadcast(change_data: dict):
+    """Enqueue a change on the event loop, dropping the oldest one when the queue is full."""
+    if broadcast_queue.full():
+        broadcast_queue.get_nowait()
+    broadcast_queue.put_nowait(change_data)
+
+
+def publish_sync_change(change_data: dict):
+    """Queue a change for WebSocket broadcast (safe to call from any thread)."""
+    if broadcast_queue is None or not ws_manager.active_connections:
+        return  # Nobody to deliver to; pollers still get it from pending_sync_changes
+    _broadcast_loop.call_soon_threadsafe(_put_broadcast, change_data)
+
+
+def queue_sync_change(change_data: dict):
+    """Record a change for polling clients and push it to WebSocket clients."""
+    with _pending_lock:
+        if len(pending_sync_changes) == pending_sync_changes.maxlen:
+            # Evict the oldest change ourselves so its path leaves pending_paths too
+            pending_paths.discard(pending_sync_changes.popleft()["path"])
+        pending_sync_changes.append(change_data)
+        pending_paths.add(change_data["path"])
+    publish_sync_change(change_data)
+
+
+def drain_sync_changes() -> list:
+    """Atomically take all pending changes."""
+    with _pending_lock:
+        changes = list(pending_sync_changes)
+        pending_sync_changes.clear()
+        pending_paths.clear()
+    return changes
+
+
+def enqueue_auto_index(path: str) -> bool:
+    """Queue a file for auto-indexing unless it's already queued."""
+    if path in auto_index_set:
+        return False
+    auto_index_queue.append(path)
+    auto_index_set.add(path)
+    return True
+
 
 def on_file_change(change: FileChange):
     """Handle file change from watcher."""
@@ -124,19 +305,20 @@ def on_file_change(change: FileChange):
         "timestamp": change.timestamp,
         "file_size": change.file_size
     }
-    pending_sync_changes.append(change_data)
+    queue_sync_change(change_data)
+    invalidate_graph()
     logger.logger.info(f"Sync: {change.change_type} - {change.file_name}")
     
     # Handle deleted files - remove from auto-index queue
     if change.change_type == "deleted":
-        if change.path in auto_index_queue:
-            auto_index_queue.remove(change.path)
+        if change.path in auto_index_set:
+            auto_index_set.discard(change.path)  # Stale deque entry is skipped when draining
             logger.logger.info(f"Removed deleted file from auto-index queue: {change.file_name}")
     
     # If auto-index is enabled and file was created, queue for indexing
     elif auto_index_enabled and change.change_type == "created":
-        auto_index_queue.append(change.path)
-        logger.logger.info(f"Auto-index queued: {change.file_name}")
+        if enqueue_auto_index(change.path):
+            logger.logger.info(f"Auto-index queued: {change.file_name}")
 
 
 document_watcher.add_change_callback(on_file_change)
@@ -144,20 +326,21 @@ document_watcher.add_change_callback(on_file_change)
 # Helper to trigger sync notification for uploaded files
 def trigger_upload_notification(file_path: str, file_name: str, file_size: int):
     """Manually trigger a notification for uploaded files."""
-    pending_sync_changes.append({
+    change_data = {
         "type": "file_change",
         "change_type": "uploaded",
         "file_name": file_name,
         "path": file_path,
         "timestamp": datetime.now().isoformat(),
         "file_size": file_size
-    })
+    }
+    queue_sync_change(change_data)
     logger.logger.info(f"Sync: uploaded - {file_name}")
     
     # If auto-index is enabled, also queue uploaded file for indexing
     if auto_index_enabled:
-        auto_index_queue.append(file_path)
-        logger.logger.info(f"Auto-index queued (uploaded): {file_name}")
+        if enqueue_auto_index(file_path):
+            logger.logger.info(f"Auto-index queued (uploaded): {file_name}")
 
 
 
@@ -167,66 +350,114 @@ async def read_root(request: Request):
     return templates.TemplateResponse("index.html", {"request": request})
 
 
-@app.post("/upload", response_model=UploadResponse)
-async def upload_file(file: UploadFile = File(...)):
-    """Upload and process a document."""
-    start_time = time.time()
-    
+@app.post("/upload", response_model=UploadResponse, status_code=202)
+async def upload_file(request: Request, background_tasks: BackgroundTasks, file: UploadFile = File(...)):
+    """Upload a document and queue it for background processing."""
     # Validate file extension
     file_ext = Path(file.filename).suffix.lower().lstrip('.')
     if file_ext not in settings.allowed_extensions:
         raise HTTPException(
             status_code=400,
-            detail=f"File type .{file_ext} not allowed. Allowed: {settings.allowed_extensions}"
+            detail=f"File type .{file_ext} not allowed. Allowed: {', '.join(sorted(settings.allowed_extensions))}"
+        )
+    
+    # Validate file size - reject early on the declared body size
+    max_bytes = settings.max_file_size_mb * 1024 * 1024
+    content_length = request.headers.get("content-length")
+    if content_length and content_length.isdigit() and int(content_length) > max_bytes:
+        raise HTTPException(
+            status_code=413,
+            detail=f"File too large. Max size: {settings.max_file_size_mb}MB"
         )
     
-    # Validate file size
-    file_size = 0
-    chunk_size = 1024 * 1024  # 1MB chunks
     temp_file = settings.upload_dir / f"{uuid.uuid4()}_{file.filename}"
     
     try:
-        # Save uploaded file
-        with open(temp_file, "wb") as buffer:
-            while True:
-                chunk = await file.read(chunk_size)
-                if not chunk:
-                    break
-                file_size += len(chunk)
-                if file_size > settings.max_file_size_mb * 1024 * 1024:
-                    raise HTTPException(
-                        status_code=413,
-                        detail=f"File too large. Max size: {settings.max_file_size_mb}MB"
-                    )
-                buffer.write(chunk)
-        
-        # Process based on file type
+        # Save uploaded file - stream the spooled upload straight to disk in a worker thread
+        file_size = await asyncio.to_thread(_save_upload, file.file, temp_file)
+        if file_size > max_bytes:
+            raise HTTPException(
+                status_code=413,
+                detail=f"File too large. Max size: {settings.max_file_size_mb}MB"
+            )
+    except Exception as e:
+        # Cleanup partial file - the background job never sees it
+        if temp_file.exists():
+            temp_file.unlink()
+        if isinstance(e, HTTPException):
+            raise
+        logger.logger.error(f"Upload error: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+    
+    _, modality = PROCESSOR_MAP.get(file_ext, (None, None))
+    modalities = [modality] if modality else []
+    
+    doc_id = str(uuid.uuid4())
+    background_tasks.add_task(_process_uploaded_file, doc_id, temp_file, file.filename, file_ext, file_size)
+    
+    # Clients learn about completion through /ws/sync and /sync/changes (events carry doc_id)
+    return UploadResponse(
+        success=True,
+        doc_id=doc_id,
+        filename=file.filename,
+        modalities_detected=[m.value for m in modalities],  # Convert enum to string
+        chunks_created=0,
+        message=f"Accepted {file.filename} for processing"
+    )
+
+
+def _save_upload(source, destination: Path) -> int:
+    """Copy an upload's file object to disk and return the written size."""
+    with open(destination, "wb") as buffer:
+        shutil.copyfileobj(source, buffer, 1024 * 1024)  # 1MB chunks
+        buffer.flush()
+        return os.fstat(buffer.fileno()).st_size
+
+
+def _notify_upload_result(doc_id: str, temp_file: Path, filename: str, event_type: str, **details):
+    """Report an upload's indexing outcome to polling and WebSocket clients."""
+    queue_sync_change({
+        "type": event_type,
+        "change_type": "indexed" if event_type == "file_indexed" else "index_failed",
+        "doc_id": doc_id,
+        "file_name": filename,
+        "path": str(temp_file),
+        "timestamp": datetime.now().isoformat(),
+        **details
+    })
+
+
+async def _process_uploaded_file(doc_id: str, temp_file: Path, filename: str, file_ext: str, file_size: int):
+    """Chunk, embed and store an uploaded file, then notify sync clients."""
+    start_time = time.time()
+    
+    try:
+        # Process based on file type (blocking model calls run in the threadpool)
         chunks = []
-        modalities = []
+        processor, modality = PROCESSOR_MAP.get(file_ext, (None, None))
         
-        if file_ext in ['pdf', 'docx', 'txt']:
-            chunks = text_processor.process_file(temp_file)
-            modalities.append(Modality.TEXT)
-        elif file_ext in ['jpg', 'jpeg', 'png', 'bmp', 'tiff']:
-            chunks = image_processor.process_file(temp_file)
-            modalities.append(Modality.IMAGE)
-        elif file_ext in ['mp3', 'wav', 'm4a', 'mp4', 'm4v', 'mpeg', 'mpg', 'avi', 'flac', 'ogg', 'aac']:
-            chunks = audio_processor.process_file(temp_file)
-            modalities.append(Modality.AUDIO)
+        if processor:
+            chunks = await run_processor(processor, modality, temp_file)
         
         if not chunks:
-            raise HTTPException(status_code=500, detail="Failed to process file")
+            logger.logger.error(f"Upload error: failed to process {filename}")
+            _notify_upload_result(
+                doc_id, temp_file, filename, "file_index_failed",
+                error="Failed to process file"
+            )
+            return
         
         # Generate embeddings
-        chunks = embedding_manager.embed_chunks(chunks)
+        chunks = await asyncio.to_thread(embedding_manager.embed_chunks, chunks)
         
         # Store in vector database
-        stored_count = vector_store.add_chunks(chunks)
+        stored_count = await asyncio.to_thread(vector_store.add_chunks, chunks)
+        invalidate_graph()
         
         processing_time = time.time() - start_time
         
         logger.logger.info(
-            f"Uploaded and processed {file.filename}: "
+            f"Uploaded and processed {filename}: "
             f"{stored_count} chunks in {processing_time:.2f}s"
         )
         
@@ -234,26 +465,20 @@ async def upload_file(file: UploadFile = File(...)):
         if document_watcher.is_running:
             trigger_upload_notification(
                 file_path=str(temp_file),
-                file_name=file.filename,
+                file_name=filename,
                 file_size=file_size
             )
         
-        return UploadResponse(
-            success=True,
-            doc_id=str(uuid.uuid4()),
-            filename=file.filename,
-            modalities_detected=[m.value for m in modalities],  # Convert enum to string
-            chunks_created=stored_count,
-            message=f"Successfully processed {file.filename}"
+        _notify_upload_result(
+            doc_id, temp_file, filename, "file_indexed",
+            chunks_created=stored_count
         )
         
-    except HTTPException:
-        raise
     except Exception as e:
         logger.logger.error(f"Upload error: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+        _notify_upload_result(doc_id, temp_file, filename, "file_index_failed", error=str(e))
     finally:
-        # Cleanup temp file
+        # Cleanup temp file once indexing is done
         if temp_file.exists():
             temp_file.unlink()
 
@@ -279,7 +504,8 @@ async def get_stats():
             "text": settings.text_embedding_model,
             "image": settings.image_embedding_model,
             "llm": settings.ollama_model
-        }
+        },
+        "embedding_cache": embedding_manager.cache.get_stats()
     }
 
 
@@ -288,6 +514,7 @@ async def reset_database():
     """Reset the vector database (for testing)."""
     try:
         vector_store.reset()
+        invalidate_graph()
         return {"message": "Database reset successfully"}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -386,11 +613,35 @@ async def get_supported_languages():
 # Initialize knowledge graph builder
 graph_builder = KnowledgeGraphBuilder(vector_store)
 
+# Built graph, reused until the knowledge base changes
+_graph_version = 0
+_graph_cache: Optional[dict] = None
+_graph_cache_key: Optional[tuple] = None
+
+
+def invalidate_graph():
+    """Mark the cached knowledge graph as stale."""
+    global _graph_version
+    _graph_version += 1
+
+
+def get_cached_graph() -> dict:
+    """Return the knowledge graph, rebuilding only after ingest/file changes."""
+    global _graph_cache, _graph_cache_key
+    
+    # Chunk count also covers store changes made outside the tracked paths
+    key = (_graph_version, vector_store.count())
+    if _graph_cache is None or _graph_cache_key != key:
+        _graph_cache = graph_builder.build_graph()
+        _graph_cache_key = key
+    return _graph_cache
+
+
 @app.get("/graph")
 async def get_knowledge_graph():
     """Get the full knowledge graph for visualization."""
     try:
-        graph_data = graph_builder.build_graph()
+        graph_data = get_cached_graph()
         return graph_data
     except Exception as e:
         logger.logger.error(f"Knowledge graph error: {e}")
@@ -401,8 +652,8 @@ async def get_knowledge_graph():
 async def get_graph_node_details(node_id: str):
     """Get detailed information about a specific node."""
     try:
-        # Rebuild graph to ensure it's current
-        graph_builder.build_graph()
+        # Make sure the builder holds a current graph
+        get_cached_graph()
         node_details = graph_builder.get_node_details(node_id)
         return node_details
     except Exception as e:
@@ -415,6 +666,10 @@ async def get_graph_node_details(node_id: str):
 @app.websocket("/ws/sync")
 async def websocket_sync(websocket: WebSocket):
     """WebSocket endpoint for real-time sync notifications."""
+    if not ws_manager.active_connections and broadcast_queue is not None:
+        # Changes left over from before the last client disconnected are stale
+        while not broadcast_queue.empty():
+            broadcast_queue.get_nowait()
     await ws_manager.connect(websocket)
     
     # Send initial status
@@ -424,22 +679,25 @@ async def websocket_sync(websocket: WebSocket):
         "watcher_status": document_watcher.get_status()
     })
     
+    # Wait on client commands and queued changes together instead of polling
+    queue = _get_broadcast_queue()
+    receive_task = asyncio.ensure_future(websocket.receive_json())
+    change_task = asyncio.ensure_future(queue.get())
+    
     try:
         while True:
-            # Check for pending changes to broadcast
-            if pending_sync_changes:
-                changes = pending_sync_changes.copy()
-                pending_sync_changes.clear()
-                
-                for change in changes:
-                    await ws_manager.broadcast(change)
+            done, _ = await asyncio.wait(
+                {receive_task, change_task},
+                return_when=asyncio.FIRST_COMPLETED
+            )
+            
+            if change_task in done:
+                await ws_manager.broadcast(change_task.result())
+                change_task = asyncio.ensure_future(queue.get())
             
-            # Also listen for client messages
-            try:
-                data = await asyncio.wait_for(
-                    websocket.receive_json(),
-                    timeout=1.0
-                )
+            if receive_task in done:
+                data = receive_task.result()
+                receive_task = asyncio.ensure_future(websocket.receive_json())
                 
                 # Handle client commands
                 if data.get("command") == "get_status":
@@ -459,13 +717,12 @@ async def websocket_sync(websocket: WebSocket):
                         "type": "watcher_stopped",
                         "message": "File watcher stopped"
                     })
-                    
-            except asyncio.TimeoutError:
-                # No message received, continue loop
-                pass
                 
     except WebSocketDisconnect:
         ws_manager.disconnect(websocket)
+    finally:
+        receive_task.cancel()
+        change_task.cancel()
 
 
 @app.get("/sync/status")
@@ -476,7 +733,7 @@ async def get_sync_status():
         "pending_changes": len(pending_sync_changes),
         "websocket_connections": len(ws_manager.active_connections),
         "auto_index_enabled": auto_index_enabled,
-        "auto_index_queue_size": len(auto_index_queue)
+        "auto_index_queue_size": len(auto_index_set)
     }
 
 
@@ -520,35 +777,30 @@ async def get_watched_files():
 @app.get("/sync/changes")
 async def get_sync_changes():
     """Get pending file changes (polling endpoint)."""
-    global pending_sync_changes
-    
     # Check for new files not yet tracked (fallback scan)
     if document_watcher.is_running:
         # Get existing tracked files before scanning
         previously_tracked = set(document_watcher.file_hashes.keys())
         
-        # Scan for all current files (this will update file_hashes)
-        current_files = document_watcher.scan_existing_files()
+        # Scan for all current files (this will update file_hashes) off the event loop
+        current_files = await asyncio.to_thread(document_watcher.scan_existing_files)
         
         # Check for files that exist now but weren't tracked before
         for file_info in current_files:
             file_path = file_info['path']
-            if file_path not in previously_tracked:
+            if file_path not in previously_tracked and file_path not in pending_paths:
                 # New file detected via scan
-                found_in_pending = any(c.get('path') == file_path for c in pending_sync_changes)
-                if not found_in_pending:
-                    pending_sync_changes.append({
-                        "type": "file_change",
-                        "change_type": "created",
-                        "file_name": file_info['name'],
-                        "path": file_path,
-                        "timestamp": datetime.now().isoformat(),
-                        "file_size": file_info['size']
-                    })
-                    logger.logger.info(f"Sync: detected new file {file_info['name']}")
+                queue_sync_change({
+                    "type": "file_change",
+                    "change_type": "created",
+                    "file_name": file_info['name'],
+                    "path": file_path,
+                    "timestamp": datetime.now().isoformat(),
+                    "file_size": file_info['size']
+                })
+                logger.logger.info(f"Sync: detected new file {file_info['name']}")
     
-    changes = pending_sync_changes.copy()
-    pending_sync_changes.clear()
+    changes = drain_sync_changes()
     return {
         "changes": changes,
         "watcher_status": document_watcher.get_status()
@@ -564,23 +816,19 @@ async def index_watched_file(file_path: str):
             raise HTTPException(status_code=404, detail="File not found")
         
         file_ext = path.suffix.lower().lstrip('.')
-        chunks = []
+        processor, modality = PROCESSOR_MAP.get(file_ext, (None, None))
         
-        if file_ext in ['pdf', 'docx', 'txt']:
-            chunks = text_processor.process_file(path)
-        elif file_ext in ['jpg', 'jpeg', 'png', 'bmp', 'tiff']:
-            chunks = image_processor.process_file(path)
-        elif file_ext in ['mp3', 'wav', 'm4a', 'mp4', 'flac', 'ogg', 'aac']:
-            chunks = audio_processor.process_file(path)
-        else:
+        if processor is None:
             raise HTTPException(status_code=400, detail=f"Unsupported file type: {file_ext}")
+        chunks = await run_processor(processor, modality, path)
         
         if chunks:
-            chunks = embedding_manager.embed_chunks(chunks)
-            stored_count = vector_store.add_chunks(chunks)
+            chunks = await asyncio.to_thread(embedding_manager.embed_chunks, chunks)
+            stored_count = await asyncio.to_thread(vector_store.add_chunks, chunks)
+            invalidate_graph()
             
             # Broadcast to WebSocket clients
-            await ws_manager.broadcast({
+            broadcast_in_background({
                 "type": "file_indexed",
                 "file_name": path.name,
                 "chunks_created": stored_count
@@ -617,67 +865,89 @@ async def get_auto_index_status():
     """Get auto-index status and queue."""
     return {
         "auto_index_enabled": auto_index_enabled,
-        "queue_size": len(auto_index_queue),
-        "queued_files": [Path(p).name for p in auto_index_queue[:10]]  # Show first 10
+        "queue_size": len(auto_index_set),
+        "queued_files": [  # Show first 10
+            Path(p).name for p in islice((p for p in auto_index_queue if p in auto_index_set), 10)
+        ]
     }
 
 
 @app.post("/sync/auto-index/process")
 async def process_auto_index_queue():
     """Process all files in the auto-index queue."""
-    global auto_index_queue
-    
-    if not auto_index_queue:
+    if not auto_index_set:
         return {"message": "Queue is empty", "processed": 0}
     
     processed = 0
     failed = 0
     results = []
+    chunks_by_file = {}
     
-    # Process each file in the queue
-    for file_path in auto_index_queue.copy():
+    # Chunk each file in the queue
+    while auto_index_queue:
+        file_path = auto_index_queue.popleft()
+        if file_path not in auto_index_set:
+            continue  # Removed (e.g. deleted) after it was queued
+        auto_index_set.discard(file_path)
+        
         try:
             path = Path(file_path)
             if not path.exists():
-                auto_index_queue.remove(file_path)
                 continue
             
             file_ext = path.suffix.lower().lstrip('.')
             chunks = []
+            processor, modality = PROCESSOR_MAP.get(file_ext, (None, None))
             
-            if file_ext in ['pdf', 'docx', 'txt']:
-                chunks = text_processor.process_file(path)
-            elif file_ext in ['jpg', 'jpeg', 'png', 'bmp', 'tiff']:
-                chunks = image_processor.process_file(path)
-            elif file_ext in ['mp3', 'wav', 'm4a', 'mp4', 'flac', 'ogg', 'aac']:
-                chunks = audio_processor.process_file(path)
+            if processor:
+                chunks = await run_processor(processor, modality, path)
             
             if chunks:
-                chunks = embedding_manager.embed_chunks(chunks)
-                stored_count = vector_store.add_chunks(chunks)
-                results.append({
-                    "file": path.name,
-                    "chunks": stored_count,
-                    "status": "success"
-                })
-                processed += 1
-                
-                # Add notification for auto-indexed file
-                pending_sync_changes.append({
-                    "type": "file_change",
-                    "change_type": "auto_indexed",
-                    "file_name": path.name,
-                    "path": file_path,
-                    "timestamp": datetime.now().isoformat(),
-                    "file_size": path.stat().st_size
-                })
+                chunks_by_file[file_path] = chunks
+            
+        except Exception as e:
+            logger.logger.error(f"Auto-index error for {file_path}: {e}")
+            failed += 1
+    
+    # Embed the chunks of every queued file in one batched model call
+    if chunks_by_file:
+        try:
+            await asyncio.to_thread(
+                embedding_manager.embed_chunks,
+                list(chain.from_iterable(chunks_by_file.values()))
+            )
+        except Exception as e:
+            logger.logger.error(f"Auto-index embedding error: {e}")
+            failed += len(chunks_by_file)
+            chunks_by_file = {}
+    
+    # Store per file so results are still reported per file
+    for file_path, chunks in chunks_by_file.items():
+        try:
+            path = Path(file_path)
+            stored_count = await asyncio.to_thread(vector_store.add_chunks, chunks)
+            invalidate_graph()
+            results.append({
+                "file": path.name,
+                "chunks": stored_count,
+                "status": "success"
+            })
+            processed += 1
             
-            auto_index_queue.remove(file_path)
+            # Add notification for auto-indexed file
+            change_data = {
+                "type": "file_change",
+                "change_type": "auto_indexed",
+                "file_name": path.name,
+                "path": file_path,
+                "timestamp": datetime.now().isoformat(),
+                "file_size": path.stat().st_size
+            }
+            queue_sync_change(change_data)
             
         except Exception as e:
             logger.logger.error(f"Auto-index error for {file_path}: {e}")
             failed += 1
-            auto_index_queue.remove(file_path)
     
     return {
         "message": f"Processed {processed} files, {failed} failed",
@@ -687,25 +957,52 @@ async def process_auto_index_queue():
     }
 
 
+DUMP_PAGE_SIZE = 1000  # Chunks fetched from the vector store per /dump page
+
+
 @app.get("/dump")
 async def dump_database():
     """Dump all contents from the vector database for debugging."""
     try:
-        # Get all items from the collection
-        results = vector_store.collection.get()
-        return {
-            "count": len(results["ids"]),
-            "data": [
-                {
-                    "id": id,
-                    "document": doc,
-                    "metadata": meta
-                }
-                for id, doc, meta in zip(results["ids"], results["documents"], results["metadatas"])
-            ]
-        }
+        total = await asyncio.to_thread(vector_store.count)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+    
+    return StreamingResponse(_dump_iter(total), media_type="application/json")
+
+
+async def _dump_iter(total: int):
+    """Stream the dump payload page by page, one serialized row at a time."""
+    yield b'{"count":' + orjson.dumps(total) + b',"data":['
+    
+    offset = 0
+    while offset < total:
+        try:
+            page = await asyncio.to_thread(
+                vector_store.get_page, offset, min(DUMP_PAGE_SIZE, total - offset)
+            )
+        except Exception as e:
+            # Abort the stream so a partial dump never ends in valid JSON
+            logger.logger.error(f"Dump failed at offset {offset}: {e}")
+            raise
+        if not page["ids"]:
+            break
+        
+        rows = zip(page["ids"], page["documents"], page["metadatas"])
+        for i, (id, doc, meta) in enumerate(rows):
+            yield (b"," if offset or i else b"") + orjson.dumps({
+                "id": id,
+                "document": doc,
+                "metadata": meta
+            })
+        offset += len(page["ids"])
+    
+    if offset != total:
+        # Chunks were removed mid-dump; don't close the JSON with a mismatched count
+        logger.logger.error(f"Dump truncated: streamed {offset} of {total} chunks")
+        raise RuntimeError(f"Dump truncated: streamed {offset} of {total} chunks")
+    
+    yield b"]}"
 
 
 @app.post("/export-reasoning-chain")
@@ -738,129 +1035,188 @@ async def export_reasoning_chain(request: QueryRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# /summarize results keyed by knowledge-base fingerprint
+_summary_cache: dict = {}
+SUMMARY_CACHE_TTL = 600  # 10 minutes
+SUMMARY_CACHE_MAX_SIZE = 8
+
+
+async def _summary_fingerprint() -> str:
+    """Cheap fingerprint of the knowledge base: store version (bumped on every add/reset) + chunk count."""
+    count = await asyncio.to_thread(vector_store.count)
+    return f"{_graph_version}:{count}"
+
+
 @app.get("/summarize")
 async def summarize_repository():
     """
     Generate an executive summary of all documents in the knowledge base.
     Includes: overview, table of contents, themes, and potential conflicts.
+    Results are cached until the knowledge base changes or the TTL expires.
     """
     try:
-        # Get all items from the collection
-        results = vector_store.collection.get()
+        fingerprint = await _summary_fingerprint()
         
-        if not results["ids"]:
-            return {
-                "success": True,
-                "summary": {
-                    "total_documents": 0,
-                    "total_chunks": 0,
-                    "modalities": [],
-                    "sources": [],
-                    "themes": [],
-                    "executive_summary": "No documents have been uploaded yet. Upload some documents to see a summary of your knowledge base.",
-                    "potential_gaps": ["No documents uploaded - knowledge base is empty"],
-                    "potential_conflicts": []
-                }
-            }
+        # Check cache
+        if fingerprint in _summary_cache:
+            summary, cached_time = _summary_cache[fingerprint]
+            age = (datetime.now() - cached_time).total_seconds()
+            if age < SUMMARY_CACHE_TTL:
+                logger.logger.info("Summarize cache hit")
+                return summary
         
-        # Analyze the repository
-        chunks = list(zip(results["ids"], results["documents"], results["metadatas"]))
+        summary = await _build_repository_summary()
         
-        # Extract unique sources and modalities
-        sources_map = {}
-        modality_counts = {}
-        all_content_samples = []
+        # Cache result, evicting the oldest entry when full
+        _summary_cache[fingerprint] = (summary, datetime.now())
+        if len(_summary_cache) > SUMMARY_CACHE_MAX_SIZE:
+            oldest = min(_summary_cache, key=lambda k: _summary_cache[k][1])
+            del _summary_cache[oldest]
         
-        for chunk_id, content, metadata in chunks:
-            source_file = metadata.get("source_file", "Unknown")
-            modality = metadata.get("modality", "text")
-            
-            # Track sources
-            if source_file not in sources_map:
-                sources_map[source_file] = {
-                    "file": source_file,
-                    "modality": modality,
-                    "chunk_count": 0,
-                    "preview": content[:200] + "..." if len(content) > 200 else content
-                }
-            sources_map[source_file]["chunk_count"] += 1
-            
-            # Track modalities
-            modality_counts[modality] = modality_counts.get(modality, 0) + 1
-            
-            # Collect content samples for theme analysis
-            if len(all_content_samples) < 20:
-                all_content_samples.append(content[:300])
-        
-        sources_list = list(sources_map.values())
-        
-        # Identify themes using keyword extraction
-        themes = _extract_themes(all_content_samples)
-        
-        # Generate executive summary using LLM
-        executive_summary = await _generate_executive_summary(
-            sources_list, 
-            themes, 
-            modality_counts,
-            all_content_samples[:5]
-        )
-        
-        # Identify potential gaps
-        gaps = _identify_knowledge_gaps(sources_list, modality_counts)
-        
-        # Check for potential conflicts by analyzing similar chunks
-        conflicts = await _detect_potential_conflicts(chunks[:50])  # Limit for performance
+        return summary
         
+    except Exception as e:
+        logger.logger.error(f"Summarize error: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+async def _build_repository_summary() -> dict:
+    """Analyze every chunk in the knowledge base and build the summary payload."""
+    # Get all items from the collection
+    results = await asyncio.to_thread(vector_store.get_all)
+    
+    if not results["ids"]:
         return {
             "success": True,
             "summary": {
-                "total_documents": len(sources_list),
-                "total_chunks": len(chunks),
-                "modalities": [
-                    {"name": mod, "count": count, "percentage": round(count/len(chunks)*100, 1)}
-                    for mod, count in modality_counts.items()
-                ],
-                "sources": sources_list,
-                "themes": themes,
-                "executive_summary": executive_summary,
-                "potential_gaps": gaps,
-                "potential_conflicts": conflicts
+                "total_documents": 0,
+                "total_chunks": 0,
+                "modalities": [],
+                "sources": [],
+                "themes": [],
+                "executive_summary": "No documents have been uploaded yet. Upload some documents to see a summary of your knowledge base.",
+                "potential_gaps": ["No documents uploaded - knowledge base is empty"],
+                "potential_conflicts": []
             }
         }
+    
+    # Analyze the repository
+    chunks = list(zip(results["ids"], results["documents"], results["metadatas"]))
+    
+    # Extract unique sources and modalities
+    sources_map = {}
+    modality_counts = {}
+    all_content_samples = []
+    
+    for chunk_id, content, metadata in chunks:
+        source_file = metadata.get("source_file", "Unknown")
+        modality = metadata.get("modality", "text")
         
-    except Exception as e:
-        logger.logger.error(f"Summarize error: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+        # Track sources
+        if source_file not in sources_map:
+            sources_map[source_file] = {
+                "file": source_file,
+                "modality": modality,
+                "chunk_count": 0,
+                "preview": content[:200] + "..." if len(content) > 200 else content
+            }
+        sources_map[source_file]["chunk_count"] += 1
+        
+        # Track modalities
+        modality_counts[modality] = modality_counts.get(modality, 0) + 1
+        
+        # Collect content samples for theme analysis
+        if len(all_content_samples) < 20:
+            all_content_samples.append(content[:300])
+    
+    sources_list = list(sources_map.values())
+    
+    # Identify themes using keyword extraction
+    themes = await _extract_themes(all_content_samples)
+    
+    # Generate executive summary using LLM
+    executive_summary = await _generate_executive_summary(
+        sources_list, 
+        themes, 
+        modality_counts,
+        all_content_samples[:5]
+    )
+    
+    # Identify potential gaps
+    gaps = _identify_knowledge_gaps(sources_list, modality_counts)
+    
+    # Check for potential conflicts by analyzing similar chunks
+    conflicts = await _detect_potential_conflicts(chunks[:50])  # Limit for performance
+    
+    return {
+        "success": True,
+        "summary": {
+            "total_documents": len(sources_list),
+            "total_chunks": len(chunks),
+            "modalities": [
+                {"name": mod, "count": count, "percentage": round(count/len(chunks)*100, 1)}
+                for mod, count in modality_counts.items()
+            ],
+            "sources": sources_list,
+            "themes": themes,
+            "executive_summary": executive_summary,
+            "potential_gaps": gaps,
+            "potential_conflicts": conflicts
+        }
+    }
 
 
-def _extract_themes(content_samples: list) -> list:
-    """Extract main themes from content using keyword analysis."""
-    from collections import Counter
-    import re
-    
-    # Common stop words to filter
-    stop_words = {
-        'the', 'a', 'an', 'is', 'are', 'was', 'were', 'be', 'been', 'being',
-        'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could',
-        'should', 'may', 'might', 'must', 'shall', 'can', 'need', 'dare',
-        'ought', 'used', 'to', 'of', 'in', 'for', 'on', 'with', 'at', 'by',
-        'from', 'as', 'into', 'through', 'during', 'before', 'after', 'above',
-        'below', 'between', 'under', 'again', 'further', 'then', 'once', 'here',
-        'there', 'when', 'where', 'why', 'how', 'all', 'each', 'few', 'more',
-        'most', 'other', 'some', 'such', 'no', 'nor', 'not', 'only', 'own',
-        'same', 'so', 'than', 'too', 'very', 'just', 'and', 'but', 'if', 'or',
-        'because', 'until', 'while', 'this', 'that', 'these', 'those', 'it',
-        'its', 'text', 'extracted', 'document', 'file', 'png', 'jpg', 'pdf'
-    }
+# Candidate theme words: 4+ letter alphabetic tokens
+_THEME_WORD_RE = re.compile(r'\b[a-zA-Z]{4,}\b')
+
+# Common stop words to filter out of themes
+_THEME_STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'is', 'are', 'was', 'were', 'be', 'been', 'being',
+    'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could',
+    'should', 'may', 'might', 'must', 'shall', 'can', 'need', 'dare',
+    'ought', 'used', 'to', 'of', 'in', 'for', 'on', 'with', 'at', 'by',
+    'from', 'as', 'into', 'through', 'during', 'before', 'after', 'above',
+    'below', 'between', 'under', 'again', 'further', 'then', 'once', 'here',
+    'there', 'when', 'where', 'why', 'how', 'all', 'each', 'few', 'more',
+    'most', 'other', 'some', 'such', 'no', 'nor', 'not', 'only', 'own',
+    'same', 'so', 'than', 'too', 'very', 'just', 'and', 'but', 'if', 'or',
+    'because', 'until', 'while', 'this', 'that', 'these', 'those', 'it',
+    'its', 'text', 'extracted', 'document', 'file', 'png', 'jpg', 'pdf'
+})
+
+
+# Themes keyed by a digest of the samples they were extracted from; content-addressed,
+# so new uploads simply produce new keys
+_theme_cache: dict = {}
+THEME_CACHE_MAX_SIZE = 32
+
+
+async def _extract_themes(content_samples: list) -> list:
+    """Extract main themes from content without blocking the event loop."""
+    key = hashlib.blake2b(
+        b"\0".join(sample.encode("utf-8") for sample in content_samples),
+        digest_size=16
+    ).digest()
+    if key in _theme_cache:
+        return _theme_cache[key]
     
-    # Extract words from all samples
-    all_words = []
-    for content in content_samples:
-        words = re.findall(r'\b[a-zA-Z]{4,}\b', content.lower())
-        all_words.extend([w for w in words if w not in stop_words])
+    themes = await asyncio.to_thread(_extract_themes_sync, content_samples)
+    
+    _theme_cache[key] = themes
+    if len(_theme_cache) > THEME_CACHE_MAX_SIZE:
+        # Dicts keep insertion order, so the first key is the oldest
+        del _theme_cache[next(iter(_theme_cache))]
+    return themes
+
+
+def _extract_themes_sync(content_samples: list) -> list:
+    """Extract main themes from content using keyword analysis."""
+    # One lower()/findall pass over all samples (newline keeps words from fusing across samples);
+    # filtering and counting stay in C-level iterator machinery
+    text = "\n".join(content_samples).lower()
+    word_counts = Counter(filterfalse(_THEME_STOP_WORDS.__contains__, _THEME_WORD_RE.findall(text)))
     
     # Get most common words as themes
-    word_counts = Counter(all_words)
     top_themes = word_counts.most_common(10)
     
     return [
@@ -869,6 +1225,11 @@ def _extract_themes(content_samples: list) -> list:
     ]
 
 
+def _base(path: str) -> str:
+    """File name of a stored source path, whichever separator it was saved with."""
+    return basename(path.replace("\\", "/"))
+
+
 async def _generate_executive_summary(sources: list, themes: list, modalities: dict, samples: list) -> str:
     """Generate an executive summary using LLM."""
     from backend.generation.llm_client import LLMClient
@@ -876,7 +1237,7 @@ async def _generate_executive_summary(sources: list, themes: list, modalities: d
     llm = LLMClient()
     
     # Build context
-    source_names = [s["file"].split("/")[-1].split("\\")[-1] for s in sources[:10]]
+    source_names = [_base(s["file"]) for s in sources[:10]]
     theme_words = [t["theme"] for t in themes[:5]]
     modality_list = list(modalities.keys())
     
@@ -900,6 +1261,13 @@ Write a professional summary that describes what this knowledge base contains an
 
 def _identify_knowledge_gaps(sources: list, modalities: dict) -> list:
     """Identify potential gaps in the knowledge base."""
+    total_chunks = sum(s["chunk_count"] for s in sources)
+    return list(_knowledge_gaps(frozenset(modalities), len(sources), total_chunks))
+
+
+@lru_cache(maxsize=64)
+def _knowledge_gaps(modalities: frozenset, source_count: int, total_chunks: int) -> tuple:
+    """Gap messages for a knowledge base shape (memoized - the inputs fully determine them)."""
     gaps = []
     
     # Check modality coverage
@@ -911,20 +1279,23 @@ def _identify_knowledge_gaps(sources: list, modalities: dict) -> list:
         gaps.append("📄 No text documents - consider adding manuals or documentation")
     
     # Check document count
-    if len(sources) < 3:
+    if source_count < 3:
         gaps.append("📚 Limited sources - consider uploading more documents for comprehensive coverage")
     
     # Check chunk distribution
-    total_chunks = sum(s["chunk_count"] for s in sources)
     if total_chunks < 10:
         gaps.append("📊 Low content density - documents may be too brief for detailed answers")
     
     # Check for diversity
     unique_modalities = len(modalities)
     if unique_modalities == 1:
-        gaps.append(f"🔄 Single modality ({list(modalities.keys())[0]}) - consider multimodal content")
+        gaps.append(f"🔄 Single modality ({next(iter(modalities))}) - consider multimodal content")
     
-    return gaps
+    return tuple(gaps)
+
+
+# Number + unit mentions compared across chunks for conflicts
+_UNIT_RE = re.compile(r'\b(\d+(?:\.\d+)?)\s*(v|V|volt|volts|kg|Kg|KG|lbs|°C|°F|%|percent)\b')
 
 
 async def _detect_potential_conflicts(chunks: list) -> list:
@@ -932,37 +1303,47 @@ async def _detect_potential_conflicts(chunks: list) -> list:
     conflicts = []
     
     # Look for numerical conflicts in similar content
-    import re
-    
     # Group chunks by similar topics
     topic_chunks = {}
-    for chunk_id, content, metadata in chunks:
-        # Extract numbers from content
-        numbers = re.findall(r'\b(\d+(?:\.\d+)?)\s*(v|V|volt|volts|kg|Kg|KG|lbs|°C|°F|%|percent)\b', content)
-        if numbers:
-            source = metadata.get("source_file", "Unknown").split("/")[-1].split("\\")[-1]
-            for num, unit in numbers:
-                key = unit.lower()
-                if key not in topic_chunks:
-                    topic_chunks[key] = []
-                topic_chunks[key].append({
-                    "value": float(num),
-                    "unit": unit,
-                    "source": source,
-                    "snippet": content[:100]
-                })
+    
+    # Scan all chunks in one regex pass. The NUL separator isn't whitespace, so a number can't
+    # pair with a unit from the next chunk; chunk start offsets map each match back to its chunk
+    chunk_starts = []
+    offset = 0
+    for _, content, _ in chunks:
+        chunk_starts.append(offset)
+        offset += len(content) + 1
+    corpus = "\0".join(content for _, content, _ in chunks)
+    
+    sources = {}
+    for match in _UNIT_RE.finditer(corpus):
+        idx = bisect_right(chunk_starts, match.start()) - 1
+        _, content, metadata = chunks[idx]
+        if idx not in sources:
+            sources[idx] = _base(metadata.get("source_file", "Unknown"))
+        num, unit = match.groups()
+        key = unit.lower()
+        if key not in topic_chunks:
+            topic_chunks[key] = []
+        topic_chunks[key].append({
+            "value": float(num),
+            "unit": unit,
+            "source": sources[idx],
+            "snippet": content[:100]
+        })
     
     # Find conflicts (different values for same unit type)
     for unit, items in topic_chunks.items():
         if len(items) >= 2:
-            values = [item["value"] for item in items]
-            if max(values) != min(values):
+            values = np.fromiter((item["value"] for item in items), dtype=np.float64, count=len(items))
+            vmin, vmax = values.min(), values.max()
+            if vmax != vmin:
                 # There's a discrepancy
                 conflicts.append({
                     "topic": f"Conflicting {unit} values",
                     "sources": [item["source"] for item in items[:2]],
                     "values": [f"{item['value']}{item['unit']}" for item in items[:2]],
-                    "severity": "high" if abs(max(values) - min(values)) / max(values) > 0.5 else "medium"
+                    "severity": "high" if (vmax - vmin) / vmax > 0.5 else "medium"
                 })
     
     return conflicts[:5]  # Limit to top 5 conflicts
@@ -970,11 +1351,31 @@ async def _detect_potential_conflicts(chunks: list) -> list:
 
 # ============ Cloud Storage Integration Endpoints ============
 
+# Provider names never change at runtime
+_SUPPORTED_PROVIDERS = [p.value for p in CloudProvider]
+
+@lru_cache(maxsize=32)
+def _to_provider(provider: str) -> CloudProvider:
+    """Coerce a provider name to its enum member (raises ValueError if unknown)."""
+    return CloudProvider(provider)
+
+
+def _validate_provider(provider: str) -> CloudProvider:
+    """Resolve a provider path/query parameter, rejecting unknown names with a 400."""
+    try:
+        return _to_provider(provider)
+    except ValueError:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid provider: {provider}. Supported: {_SUPPORTED_PROVIDERS}"
+        )
+
+
 @app.get("/cloud/providers")
 async def get_cloud_providers():
     """Get list of supported and connected cloud storage providers."""
     return {
-        "supported": [p.value for p in CloudProvider],
+        "supported": _SUPPORTED_PROVIDERS,
         "connected": cloud_storage_manager.get_connected_providers()
     }
 
@@ -989,18 +1390,13 @@ async def connect_cloud_provider(
     aws_access_key_id: str = None,
     aws_secret_access_key: str = None,
     aws_region: str = None,
-    s3_bucket: str = None
+    s3_bucket: str = None,
+    expires_in: int = None
 ):
-    """Connect to a cloud storage provider."""
+    """Connect to a cloud storage provider (expires_in: access token lifetime in seconds)."""
     try:
         # Validate provider
-        try:
-            cloud_provider = CloudProvider(provider)
-        except ValueError:
-            raise HTTPException(
-                status_code=400, 
-                detail=f"Invalid provider: {provider}. Supported: {[p.value for p in CloudProvider]}"
-            )
+        cloud_provider = _validate_provider(provider)
         
         # Create credentials
         credentials = CloudCredentials(
@@ -1012,7 +1408,8 @@ async def connect_cloud_provider(
             aws_access_key_id=aws_access_key_id,
             aws_secret_access_key=aws_secret_access_key,
             aws_region=aws_region,
-            s3_bucket=s3_bucket
+            s3_bucket=s3_bucket,
+            expires_at=datetime.utcnow() + timedelta(seconds=expires_in) if expires_in else None
         )
         
         result = await cloud_storage_manager.connect_provider(credentials)
@@ -1033,10 +1430,7 @@ async def connect_cloud_provider(
 async def disconnect_cloud_provider(provider: str):
     """Disconnect from a cloud storage provider."""
     try:
-        try:
-            cloud_provider = CloudProvider(provider)
-        except ValueError:
-            raise HTTPException(status_code=400, detail=f"Invalid provider: {provider}")
+        cloud_provider = _validate_provider(provider)
         
         result = await cloud_storage_manager.disconnect_provider(cloud_provider)
         return result
@@ -1052,10 +1446,7 @@ async def disconnect_cloud_provider(provider: str):
 async def list_cloud_files(provider: str, folder_id: str = None):
     """List files from a cloud storage provider."""
     try:
-        try:
-            cloud_provider = CloudProvider(provider)
-        except ValueError:
-            raise HTTPException(status_code=400, detail=f"Invalid provider: {provider}")
+        cloud_provider = _validate_provider(provider)
         
         if provider not in cloud_storage_manager.get_connected_providers():
             raise HTTPException(status_code=400, detail=f"Provider {provider} is not connected")
@@ -1080,10 +1471,7 @@ async def list_cloud_files(provider: str, folder_id: str = None):
 async def search_cloud_files(provider: str, query: str):
     """Search files in a cloud storage provider."""
     try:
-        try:
-            cloud_provider = CloudProvider(provider)
-        except ValueError:
-            raise HTTPException(status_code=400, detail=f"Invalid provider: {provider}")
+        cloud_provider = _validate_provider(provider)
         
         if provider not in cloud_storage_manager.get_connected_providers():
             raise HTTPException(status_code=400, detail=f"Provider {provider} is not connected")
@@ -1129,14 +1517,53 @@ async def search_all_cloud_providers(query: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+async def _chunk_imported_file(result: dict) -> list:
+    """Process an imported cloud file into chunks, recording failures on `result`."""
+    local_path = Path(result["local_path"])
+    file_ext = local_path.suffix.lower().lstrip('.')
+    processor, modality = PROCESSOR_MAP.get(file_ext, (None, None))
+    
+    try:
+        if processor:
+            return await run_processor(processor, modality, local_path)
+    except Exception as e:
+        logger.logger.error(f"Auto-index error for {local_path.name}: {e}")
+        result["auto_indexed"] = False
+        result["index_error"] = str(e)
+    return []
+
+
+async def _index_imported_files(results: list):
+    """Auto-index imported cloud files with one embedding call and one store write."""
+    # Files are independent, so chunk them concurrently
+    chunk_lists = await asyncio.gather(*(_chunk_imported_file(result) for result in results))
+    per_file = [(result, chunks) for result, chunks in zip(results, chunk_lists) if chunks]
+    if not per_file:
+        return
+    
+    all_chunks = [chunk for _, chunks in per_file for chunk in chunks]
+    try:
+        await asyncio.to_thread(embedding_manager.embed_chunks, all_chunks)
+        stored_count = await asyncio.to_thread(vector_store.add_chunks, all_chunks)
+        invalidate_graph()
+    except Exception as e:
+        logger.logger.error(f"Auto-index error: {e}")
+        for result, _ in per_file:
+            result["auto_indexed"] = False
+            result["index_error"] = str(e)
+        return
+    
+    # Partition the stored count back per file (add_chunks stores every embedded chunk or none)
+    for result, chunks in per_file:
+        result["auto_indexed"] = True
+        result["chunks_created"] = sum(1 for c in chunks if c.embedding is not None) if stored_count else 0
+
+
 @app.post("/cloud/{provider}/import")
 async def import_cloud_file(provider: str, file_id: str, auto_index: bool = False):
     """Import a file from cloud storage to the local knowledge base."""
     try:
-        try:
-            cloud_provider = CloudProvider(provider)
-        except ValueError:
-            raise HTTPException(status_code=400, detail=f"Invalid provider: {provider}")
+        cloud_provider = _validate_provider(provider)
         
         if provider not in cloud_storage_manager.get_connected_providers():
             raise HTTPException(status_code=400, detail=f"Provider {provider} is not connected")
@@ -1153,30 +1580,10 @@ async def import_cloud_file(provider: str, file_id: str, auto_index: bool = Fals
         
         # Auto-index if requested
         if auto_index:
-            local_path = Path(result["local_path"])
-            file_ext = local_path.suffix.lower().lstrip('.')
-            chunks = []
-            
-            try:
-                if file_ext in ['pdf', 'docx', 'txt']:
-                    chunks = text_processor.process_file(local_path)
-                elif file_ext in ['jpg', 'jpeg', 'png', 'bmp', 'tiff']:
-                    chunks = image_processor.process_file(local_path)
-                elif file_ext in ['mp3', 'wav', 'm4a', 'mp4', 'flac', 'ogg', 'aac']:
-                    chunks = audio_processor.process_file(local_path)
-                
-                if chunks:
-                    chunks = embedding_manager.embed_chunks(chunks)
-                    stored_count = vector_store.add_chunks(chunks)
-                    result["auto_indexed"] = True
-                    result["chunks_created"] = stored_count
-            except Exception as e:
-                logger.logger.error(f"Auto-index error: {e}")
-                result["auto_indexed"] = False
-                result["index_error"] = str(e)
+            await _index_imported_files([result])
         
         # Broadcast notification
-        await ws_manager.broadcast({
+        broadcast_in_background({
             "type": "cloud_import",
             "provider": provider,
             "file_name": result["file_name"],
@@ -1197,10 +1604,7 @@ async def import_cloud_file(provider: str, file_id: str, auto_index: bool = Fals
 async def import_cloud_files_batch(provider: str, file_ids: list[str], auto_index: bool = False):
     """Import multiple files from cloud storage."""
     try:
-        try:
-            cloud_provider = CloudProvider(provider)
-        except ValueError:
-            raise HTTPException(status_code=400, detail=f"Invalid provider: {provider}")
+        cloud_provider = _validate_provider(provider)
         
         if provider not in cloud_storage_manager.get_connected_providers():
             raise HTTPException(status_code=400, detail=f"Provider {provider} is not connected")
@@ -1214,28 +1618,10 @@ async def import_cloud_files_batch(provider: str, file_ids: list[str], auto_inde
         
         # Auto-index if requested
         if auto_index:
-            for result in results:
-                if result.get("success") and result.get("local_path"):
-                    local_path = Path(result["local_path"])
-                    file_ext = local_path.suffix.lower().lstrip('.')
-                    chunks = []
-                    
-                    try:
-                        if file_ext in ['pdf', 'docx', 'txt']:
-                            chunks = text_processor.process_file(local_path)
-                        elif file_ext in ['jpg', 'jpeg', 'png', 'bmp', 'tiff']:
-                            chunks = image_processor.process_file(local_path)
-                        elif file_ext in ['mp3', 'wav', 'm4a', 'mp4', 'flac', 'ogg', 'aac']:
-                            chunks = audio_processor.process_file(local_path)
-                        
-                        if chunks:
-                            chunks = embedding_manager.embed_chunks(chunks)
-                            stored_count = vector_store.add_chunks(chunks)
-                            result["auto_indexed"] = True
-                            result["chunks_created"] = stored_count
-                    except Exception as e:
-                        result["auto_indexed"] = False
-                        result["index_error"] = str(e)
+            await _index_imported_files([
+                result for result in results
+                if result.get("success") and result.get("local_path")
+            ])
         
         successful = sum(1 for r in results if r.get("success"))
         
@@ -1366,76 +1752,136 @@ async def draft_document(request: DraftRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+_DRAFT_TEMPLATES_JSON = orjson.dumps({
+    "templates": [
+        {
+            "type": "email",
+            "name": "Email",
+            "icon": "📧",
+            "description": "Professional email with subject, greeting, body, and signature",
+            "structure": ["subject", "greeting", "opening", "body", "closing", "signature"]
+        },
+        {
+            "type": "report",
+            "name": "Report",
+            "icon": "📊",
+            "description": "Formal report with executive summary, findings, and recommendations",
+            "structure": ["title", "executive_summary", "findings", "recommendations", "conclusion"]
+        },
+        {
+            "type": "memo",
+            "name": "Memo",
+            "icon": "📝",
+            "description": "Internal memo with header, purpose, and action items",
+            "structure": ["header", "purpose", "background", "key_points", "action_items"]
+        },
+        {
+            "type": "summary",
+            "name": "Summary",
+            "icon": "📋",
+            "description": "Concise summary with key points and overview",
+            "structure": ["overview", "key_points", "conclusion"]
+        },
+        {
+            "type": "letter",
+            "name": "Letter",
+            "icon": "✉️",
+            "description": "Formal letter with date, greeting, body, and signature",
+            "structure": ["date", "greeting", "opening", "body", "closing", "signature"]
+        }
+    ]
+})
+
+
 @app.get("/draft/templates")
 async def get_draft_templates():
     """Get available document templates and their structures."""
-    return {
-        "templates": [
-            {
-                "type": "email",
-                "name": "Email",
-                "icon": "📧",
-                "description": "Professional email with subject, greeting, body, and signature",
-                "structure": ["subject", "greeting", "opening", "body", "closing", "signature"]
-            },
-            {
-                "type": "report",
-                "name": "Report",
-                "icon": "📊",
-                "description": "Formal report with executive summary, findings, and recommendations",
-                "structure": ["title", "executive_summary", "findings", "recommendations", "conclusion"]
-            },
-            {
-                "type": "memo",
-                "name": "Memo",
-                "icon": "📝",
-                "description": "Internal memo with header, purpose, and action items",
-                "structure": ["header", "purpose", "background", "key_points", "action_items"]
-            },
-            {
-                "type": "summary",
-                "name": "Summary",
-                "icon": "📋",
-                "description": "Concise summary with key points and overview",
-                "structure": ["overview", "key_points", "conclusion"]
-            },
-            {
-                "type": "letter",
-                "name": "Letter",
-                "icon": "✉️",
-                "description": "Formal letter with date, greeting, body, and signature",
-                "structure": ["date", "greeting", "opening", "body", "closing", "signature"]
-            }
-        ]
-    }
+    return Response(content=_DRAFT_TEMPLATES_JSON, media_type="application/json")
+
+
+_DRAFT_TONES_JSON = orjson.dumps({
+    "tones": [
+        {"value": "formal", "label": "Formal", "icon": "🎩", "description": "Formal, professional language"},
+        {"value": "professional", "label": "Professional", "icon": "💼", "description": "Clear, professional tone"},
+        {"value": "friendly", "label": "Friendly", "icon": "😊", "description": "Warm, approachable language"},
+        {"value": "urgent", "label": "Urgent", "icon": "⚡", "description": "Conveys urgency and importance"},
+        {"value": "apologetic", "label": "Apologetic", "icon": "🙏", "description": "Sincere, humble tone"},
+        {"value": "confident", "label": "Confident", "icon": "💪", "description": "Assertive, decisive language"}
+    ]
+})
 
 
 @app.get("/draft/tones")
 async def get_draft_tones():
     """Get available tone options for drafting."""
-    return {
-        "tones": [
-            {"value": "formal", "label": "Formal", "icon": "🎩", "description": "Formal, professional language"},
-            {"value": "professional", "label": "Professional", "icon": "💼", "description": "Clear, professional tone"},
-            {"value": "friendly", "label": "Friendly", "icon": "😊", "description": "Warm, approachable language"},
-            {"value": "urgent", "label": "Urgent", "icon": "⚡", "description": "Conveys urgency and importance"},
-            {"value": "apologetic", "label": "Apologetic", "icon": "🙏", "description": "Sincere, humble tone"},
-            {"value": "confident", "label": "Confident", "icon": "💪", "description": "Assertive, decisive language"}
-        ]
-    }
+    return Response(content=_DRAFT_TONES_JSON, media_type="application/json")
 
 
 # ============ Automated Presentation Generator Endpoints ============
 
 from backend.generation.presentation_generator import (
     PresentationGenerator, PresentationRequest, PresentationResponse,
-    PresentationTheme
+    PresentationTheme, PRESENTATION_THEMES
 )
-from fastapi.responses import FileResponse
 
 # Initialize presentation generator
 presentation_generator = PresentationGenerator(retriever)
 
+# Constant theme catalog, serialized once at import
+_PRESENTATION_THEMES_JSON = orjson.dumps({"themes": PRESENTATION_THEMES})
+
+# Generated presentations, newest first; rescanned when the output directory changes
+# and updated in place after each generation
+_presentations_index: Optional[list] = None
+_presentations_mtime_ns: Optional[int] = None
+_presentations_lock = threading.Lock()  # Scans and updates run in worker threads
+
+
+def _presentation_entry(path: Path) -> dict:
+    """Listing entry for a generated presentation file."""
+    stat = path.stat()
+    return {
+        "filename": path.name,
+        "size_bytes": stat.st_size,
+        "created": datetime.fromtimestamp(stat.st_ctime).isoformat(),
+        "download_url": f"/presentations/{path.name}"
+    }
+
+
+def _load_presentations_index() -> list:
+    """Get the presentations index, rebuilding it when files were added or removed.
+
+    Creating, deleting or renaming a file bumps the directory's mtime, so one stat of
+    the directory replaces a stat per presentation on unchanged listings.
+    """
+    global _presentations_index, _presentations_mtime_ns
+    output_dir = presentation_generator.output_dir
+    with _presentations_lock:
+        mtime_ns = output_dir.stat().st_mtime_ns
+        if _presentations_index is None or mtime_ns != _presentations_mtime_ns:
+            files = [_presentation_entry(f) for f in output_dir.glob("*.pptx")]
+            # Sort by creation time, newest first
+            files.sort(key=lambda x: x["created"], reverse=True)
+            _presentations_index = files
+            _presentations_mtime_ns = mtime_ns
+        return _presentations_index
+
+
+def _record_presentation(filename: str):
+    """Put a finished presentation at the front of the index.
+
+    A listing that ran while the file was still being saved may have cached a partial
+    size; the entry is replaced with one taken after the save completed.
+    """
+    global _presentations_index
+    with _presentations_lock:
+        if _presentations_index is None:
+            return  # First listing scans the finished file
+        entry = _presentation_entry(presentation_generator.output_dir / filename)
+        _presentations_index = [entry] + [
+            e for e in _presentations_index if e["filename"] != filename
+        ]
+
 
 @app.post("/presentation", response_model=PresentationResponse)
 async def generate_presentation(request: PresentationRequest):
@@ -1455,6 +1901,7 @@ async def generate_presentation(request: PresentationRequest):
     """
     try:
         response = await presentation_generator.generate_presentation(request)
+        await asyncio.to_thread(_record_presentation, response.filename)
         logger.logger.info(
             f"📊 Generated presentation: {response.filename} "
             f"({response.num_slides} slides, {response.processing_time:.1f}s)"
@@ -1466,82 +1913,40 @@ async def generate_presentation(request: PresentationRequest):
 
 
 @app.get("/presentations/{filename}")
-async def download_presentation(filename: str):
+async def download_presentation(filename: str, request: Request):
     """Download a generated presentation file."""
     filepath = settings.upload_dir / "presentations" / filename
     
-    if not filepath.exists():
+    try:
+        stat = await asyncio.to_thread(filepath.stat)
+    except FileNotFoundError:
         raise HTTPException(status_code=404, detail="Presentation not found")
     
+    # Presentations are written once, so mtime + size identify the content
+    etag = f'W/"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    
+    # Passing stat_result saves FileResponse a second stat of the file
     return FileResponse(
         path=str(filepath),
         filename=filename,
-        media_type="application/vnd.openxmlformats-officedocument.presentationml.presentation"
+        media_type="application/vnd.openxmlformats-officedocument.presentationml.presentation",
+        stat_result=stat,
+        headers={"ETag": etag}
     )
 
 
 @app.get("/presentation/themes")
 async def get_presentation_themes():
     """Get available presentation themes."""
-    return {
-        "themes": [
-            {
-                "value": "professional",
-                "name": "Professional",
-                "icon": "💼",
-                "description": "Classic dark blue with orange accents",
-                "colors": ["#1E3A5F", "#F08030"]
-            },
-            {
-                "value": "modern",
-                "name": "Modern",
-                "icon": "🎨",
-                "description": "Purple and teal gradient style",
-                "colors": ["#6C5CE7", "#00D2D3"]
-            },
-            {
-                "value": "minimal",
-                "name": "Minimal",
-                "icon": "⬜",
-                "description": "Clean grayscale with blue accents",
-                "colors": ["#2D3A4B", "#007BFF"]
-            },
-            {
-                "value": "corporate",
-                "name": "Corporate",
-                "icon": "🏢",
-                "description": "Traditional corporate blue and gold",
-                "colors": ["#00528A", "#FFB800"]
-            },
-            {
-                "value": "creative",
-                "name": "Creative",
-                "icon": "✨",
-                "description": "Vibrant pink and teal",
-                "colors": ["#E04389", "#4ECEC3"]
-            }
-        ]
-    }
+    return Response(content=_PRESENTATION_THEMES_JSON, media_type="application/json")
 
 
 @app.get("/presentation/list")
 async def list_presentations():
     """List all generated presentations."""
-    presentations_dir = settings.upload_dir / "presentations"
-    presentations_dir.mkdir(exist_ok=True)
-    
-    files = []
-    for f in presentations_dir.glob("*.pptx"):
-        stat = f.stat()
-        files.append({
-            "filename": f.name,
-            "size_bytes": stat.st_size,
-            "created": datetime.fromtimestamp(stat.st_ctime).isoformat(),
-            "download_url": f"/presentations/{f.name}"
-        })
-    
-    # Sort by creation time, newest first
-    files.sort(key=lambda x: x["created"], reverse=True)
+    files = await asyncio.to_thread(_load_presentations_index)
     
     return {
         "presentations": files,
@@ -1551,5 +1956,6 @@ async def list_presentations():
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host=settings.host, port=settings.port)
+    # permessage-deflate compresses /ws/sync frames
+    uvicorn.run(app, host=settings.host, port=settings.port, ws_per_message_deflate=True)
 
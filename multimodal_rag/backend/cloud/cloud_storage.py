@@ -4,20 +4,131 @@ Unified interface for Google Drive, OneDrive, AWS S3, and Dropbox
 """
 
 import os
-import io
+import sys
 import json
+import orjson
+import time
 import asyncio
 import tempfile
+import threading
+import mimetypes
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import Optional, List, Dict, Any, BinaryIO
+from typing import Optional, List, Dict, Any, BinaryIO, AsyncIterator, Awaitable, Callable
 from enum import Enum
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from abc import ABC, abstractmethod
 import hashlib
+from collections import deque
+from itertools import islice
+from functools import lru_cache
+from urllib.parse import quote
 
+from backend.config import settings
+from backend.cloud.download_cache import DownloadCache
 from backend.utils.logger import logger
 
+# Optional provider SDKs (see CLOUD_STORAGE_README.md); providers refuse to initialize without them
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+try:
+    import boto3
+    from botocore.config import Config as BotoConfig
+except ImportError:
+    boto3 = None
+
+_guess_type = mimetypes.guess_type
+
+# Extensions we import, resolved once; other names fall back to mimetypes
+_EXT_MIME = {
+    ext: _guess_type(f"file{ext}")[0]
+    for ext in ('.pdf', '.docx', '.doc', '.txt', '.jpg', '.jpeg', '.png', '.bmp',
+                '.tiff', '.mp3', '.wav', '.m4a', '.mp4')
+    if _guess_type(f"file{ext}")[0]
+}
+
+
+def _guess_mime_type(filename: str) -> str:
+    """Guess a MIME type from a filename, checking the common import extensions first"""
+    dot = filename.rfind('.')
+    if dot >= 0:
+        mime_type = _EXT_MIME.get(filename[dot:].lower())
+        if mime_type:
+            return mime_type
+    return _guess_type(filename)[0] or 'application/octet-stream'
+
+try:
+    from ciso8601 import parse_datetime as _parse_timestamp
+except ImportError:
+    def _parse_timestamp(value: str) -> datetime:
+        """Parse an ISO-8601 timestamp from a provider API (fallback when ciso8601 is missing)"""
+        if value.endswith('Z'):
+            value = value[:-1] + '+00:00'
+        return datetime.fromisoformat(value)
+
+
+# Extension -> MIME type used for Google Drive mimeType query filters
+_MIME_MAP = {
+    'pdf': 'application/pdf',
+    'docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
+    'doc': 'application/msword',
+    'txt': 'text/plain',
+    'jpg': 'image/jpeg',
+    'jpeg': 'image/jpeg',
+    'png': 'image/png',
+    'mp3': 'audio/mpeg',
+    'wav': 'audio/wav',
+    'm4a': 'audio/mp4',
+}
+
+
+@lru_cache(maxsize=32)
+def _mime_conditions(file_types: tuple) -> str:
+    """Build the Drive query clause matching any of the given extensions ('' if none are known)"""
+    mime_types = dict.fromkeys(
+        _MIME_MAP[ft.lower()] for ft in file_types if ft.lower() in _MIME_MAP
+    )
+    if not mime_types:
+        return ""
+    return "(" + " or ".join(f"mimeType='{mime_type}'" for mime_type in mime_types) + ")"
+
+
+def _drive_literal(value: str) -> str:
+    """Escape a value for use inside a quoted Drive query string"""
+    return value.replace('\\', '\\\\').replace("'", "\\'")
+
+
+def _odata_literal(value: str) -> str:
+    """Escape and URL-encode a value for a quoted OData function argument (Graph search)"""
+    return quote(value.replace("'", "''"), safe='')
+
+
+def _extension_filter(file_types: Optional[List[str]]) -> Optional[frozenset]:
+    """Lower-cased extension set for per-item filtering (None means no filter)"""
+    return frozenset(ft.lower() for ft in file_types) if file_types else None
+
+
+# Slotted dataclasses (no per-instance __dict__) on Python 3.10+, plain ones on 3.9
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+# Shared read-only default for optional nested JSON objects (never mutate)
+_EMPTY: Dict[str, Any] = {}
+
+
+class _ChunkCollector:
+    """Minimal file-like sink that keeps downloaded chunks instead of copying them into a buffer"""
+    
+    def __init__(self):
+        self.chunks: List[bytes] = []
+    
+    def write(self, data: bytes) -> int:
+        self.chunks.append(data)
+        return len(data)
+
 
 class CloudProvider(Enum):
     """Supported cloud storage providers"""
@@ -27,7 +138,7 @@ class CloudProvider(Enum):
     DROPBOX = "dropbox"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class CloudFile:
     """Represents a file in cloud storage"""
     id: str
@@ -40,7 +151,7 @@ class CloudFile:
     is_folder: bool = False
     parent_id: Optional[str] = None
     download_url: Optional[str] = None
-    metadata: Dict[str, Any] = field(default_factory=dict)
+    metadata: Optional[Dict[str, Any]] = None
     
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -54,11 +165,11 @@ class CloudFile:
             "is_folder": self.is_folder,
             "parent_id": self.parent_id,
             "download_url": self.download_url,
-            "metadata": self.metadata
+            "metadata": self.metadata or {}
         }
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class CloudCredentials:
     """Cloud provider credentials"""
     provider: CloudProvider
@@ -83,9 +194,33 @@ class CloudCredentials:
 class BaseCloudProvider(ABC):
     """Base class for cloud storage providers"""
     
-    def __init__(self, credentials: CloudCredentials):
+    MAX_CONCURRENT_DOWNLOADS = 16
+    SEARCH_RESULT_LIMIT = 50  # Searches return a capped result set; only list_files reads everything
+    STREAM_CHUNK_SIZE = 1024 * 1024  # Bytes per chunk yielded by stream_file
+    REFRESH_RETRY_SECONDS = 60
+    
+    # aiohttp defaults cap a session at 10 connections per host, which would throttle
+    # the download semaphore since each provider talks to a single API host
+    HTTP_POOL_LIMIT = 64
+    HTTP_POOL_LIMIT_PER_HOST = 32
+    HTTP_KEEPALIVE_SECONDS = 60
+    DNS_CACHE_SECONDS = 300
+    
+    # Pre-authenticated download links last 1h+ at the providers; refetch well before that
+    DOWNLOAD_URL_TTL = 600  # seconds
+    DOWNLOAD_URL_CACHE_SIZE = 4096
+    
+    def __init__(self, credentials: CloudCredentials, connector=None):
         self.credentials = credentials
         self._initialized = False
+        self._connector = connector  # Connection pool shared across providers (owned by the manager)
+        self._session = None  # Long-lived HTTP session for aiohttp-based providers
+        self._download_semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_DOWNLOADS)
+        self._refresh_lock = asyncio.Lock()
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._download_urls: Dict[str, tuple] = {}  # file_id -> (url, cached_at)
+        # Called with the credentials after each successful token refresh (set by the manager)
+        self.on_credentials_refreshed: Optional[Callable[[CloudCredentials], Awaitable[None]]] = None
     
     @abstractmethod
     async def initialize(self) -> bool:
@@ -114,6 +249,131 @@ class BaseCloudProvider(ABC):
         """Search for files"""
         pass
     
+    async def stream_file(self, file_id: str) -> AsyncIterator[bytes]:
+        """Download a file as a stream of chunks; yields nothing if the download fails.
+        
+        Providers that can stream override this; the default yields the whole download.
+        """
+        data = await self.download_file(file_id)
+        if data:
+            yield data
+    
+    async def get_files_info(self, file_ids: List[str]) -> List[Optional[CloudFile]]:
+        """Get metadata for several files concurrently (results in file_ids order)"""
+        return list(await asyncio.gather(*map(self.get_file_info, file_ids)))
+    
+    async def download_files(self, file_ids: List[str]) -> List[bytes]:
+        """Download several files concurrently, at most MAX_CONCURRENT_DOWNLOADS at a time.
+        
+        Results are in file_ids order; a failed download yields b'' like download_file.
+        """
+        async def _download(file_id: str) -> bytes:
+            async with self._download_semaphore:
+                return await self.download_file(file_id)
+        
+        results = await asyncio.gather(*map(_download, file_ids), return_exceptions=True)
+        for file_id, result in zip(file_ids, results):
+            if isinstance(result, BaseException):
+                logger.error(f"{self.provider_name} download error for {file_id}: {result}")
+        return [b'' if isinstance(result, BaseException) else result for result in results]
+    
+    async def _refresh_token(self) -> bool:
+        """Exchange the refresh token for a new access token (providers override)"""
+        return False
+    
+    async def refresh_credentials(self) -> bool:
+        """Refresh the access token once, even if several callers ask at the same time"""
+        async with self._refresh_lock:
+            # Another caller may have refreshed while we waited for the lock
+            if not self.credentials.is_expired():
+                return True
+            try:
+                if not await self._refresh_token():
+                    return False
+            except Exception as e:
+                logger.error(f"{self.provider_name} token refresh error: {e}")
+                return False
+        
+        if self.on_credentials_refreshed is not None:
+            await self.on_credentials_refreshed(self.credentials)
+        return True
+    
+    def _start_token_refresh(self):
+        """Refresh the access token in the background shortly before it expires"""
+        if self.credentials.refresh_token and self.credentials.expires_at and self._refresh_task is None:
+            self._refresh_task = asyncio.create_task(self._refresh_loop())
+    
+    async def _refresh_loop(self):
+        """Sleep until five minutes before expiry, then refresh; repeat with the new expiry"""
+        while self.credentials.expires_at:
+            wait = (self.credentials.expires_at - timedelta(minutes=5) - datetime.utcnow()).total_seconds()
+            await asyncio.sleep(max(wait, 1))
+            if not await self.refresh_credentials():
+                await asyncio.sleep(self.REFRESH_RETRY_SECONDS)
+    
+    def _remember_download_url(self, file_id: str, url: Optional[str]):
+        """Cache a pre-authenticated download link for a file"""
+        if not url:
+            return
+        if file_id not in self._download_urls and len(self._download_urls) >= self.DOWNLOAD_URL_CACHE_SIZE:
+            self._download_urls.pop(next(iter(self._download_urls)))
+        self._download_urls[file_id] = (url, datetime.now())
+    
+    async def _fetch_download_url(self, file_id: str) -> Optional[str]:
+        """Ask the provider for a pre-authenticated download link (None if unsupported)"""
+        return None
+    
+    def _cached_download_url(self, file_id: str) -> Optional[str]:
+        """Return a still-fresh cached download link, dropping an expired one"""
+        cached = self._download_urls.get(file_id)
+        if cached is None:
+            return None
+        url, cached_time = cached
+        if (datetime.now() - cached_time).total_seconds() < self.DOWNLOAD_URL_TTL:
+            return url
+        del self._download_urls[file_id]
+        return None
+    
+    async def _get_download_url(self, file_id: str) -> Optional[str]:
+        """Get a cached or freshly fetched pre-authenticated download link"""
+        url = self._cached_download_url(file_id)
+        if url:
+            return url
+        
+        try:
+            url = await self._fetch_download_url(file_id)
+        except Exception as e:
+            logger.warning(f"Could not get download link for {file_id}: {e}")
+            return None
+        self._remember_download_url(file_id, url)
+        return url
+    
+    @classmethod
+    def create_connector(cls):
+        """Create a pooled aiohttp connector (call from inside the event loop)"""
+        return aiohttp.TCPConnector(
+            limit=cls.HTTP_POOL_LIMIT,
+            limit_per_host=cls.HTTP_POOL_LIMIT_PER_HOST,
+            ttl_dns_cache=cls.DNS_CACHE_SECONDS,
+            keepalive_timeout=cls.HTTP_KEEPALIVE_SECONDS
+        )
+    
+    def _create_session(self):
+        """Create the provider's aiohttp session on the shared pool, or on its own one"""
+        if self._connector is not None and not self._connector.closed:
+            # Closing the session must leave the shared pool open for the other providers
+            return aiohttp.ClientSession(connector=self._connector, connector_owner=False)
+        return aiohttp.ClientSession(connector=self.create_connector())
+    
+    async def close(self):
+        """Release the provider's pooled HTTP connections and stop token refresh"""
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            self._refresh_task = None
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+    
     @property
     def provider_name(self) -> str:
         return self.credentials.provider.value
@@ -123,6 +383,9 @@ class GoogleDriveProvider(BaseCloudProvider):
     """Google Drive integration"""
     
     SCOPES = ['https://www.googleapis.com/auth/drive.readonly']
+    PAGE_SIZE = 1000  # Drive API maximum
+    BATCH_LIMIT = 100  # Calls per batch HTTP request
+    FILE_FIELDS = "id, name, mimeType, size, modifiedTime, parents, webContentLink"
     
     async def initialize(self) -> bool:
         """Initialize Google Drive connection"""
@@ -144,11 +407,15 @@ class GoogleDriveProvider(BaseCloudProvider):
                 refresh_token=self.credentials.refresh_token,
                 token_uri="https://oauth2.googleapis.com/token",
                 client_id=self.credentials.api_key,
-                client_secret=self.credentials.api_secret
+                client_secret=self.credentials.api_secret,
+                expiry=self.credentials.expires_at
             )
             
+            self._creds = creds
             self._service = build('drive', 'v3', credentials=creds)
+            self._local = threading.local()
             self._initialized = True
+            self._start_token_refresh()
             logger.info("Google Drive provider initialized successfully")
             return True
             
@@ -156,6 +423,15 @@ class GoogleDriveProvider(BaseCloudProvider):
             logger.error(f"Failed to initialize Google Drive: {e}")
             return False
     
+    async def _refresh_token(self) -> bool:
+        """Refresh the Drive OAuth token (google-auth refresh is blocking)"""
+        from google.auth.transport.requests import Request
+        
+        await asyncio.to_thread(self._creds.refresh, Request())
+        self.credentials.access_token = self._creds.token
+        self.credentials.expires_at = self._creds.expiry
+        return True
+    
     async def list_files(self, folder_id: Optional[str] = None,
                          file_types: Optional[List[str]] = None) -> List[CloudFile]:
         """List files in Google Drive folder"""
@@ -166,44 +442,20 @@ class GoogleDriveProvider(BaseCloudProvider):
             query_parts = ["trashed=false"]
             
             if folder_id:
-                query_parts.append(f"'{folder_id}' in parents")
+                query_parts.append(f"'{_drive_literal(folder_id)}' in parents")
             else:
                 query_parts.append("'root' in parents")
             
             if file_types:
-                mime_conditions = []
-                for ft in file_types:
-                    mime_type = self._get_mime_type(ft)
-                    if mime_type:
-                        mime_conditions.append(f"mimeType='{mime_type}'")
+                mime_conditions = _mime_conditions(tuple(file_types))
                 if mime_conditions:
-                    query_parts.append(f"({' or '.join(mime_conditions)})")
+                    query_parts.append(mime_conditions)
             
             query = " and ".join(query_parts)
             
-            results = self._service.files().list(
-                q=query,
-                pageSize=100,
-                fields="files(id, name, mimeType, size, modifiedTime, parents, webContentLink)"
-            ).execute()
+            items = await asyncio.to_thread(self._list_all, query, self.FILE_FIELDS)
             
-            files = []
-            for item in results.get('files', []):
-                cloud_file = CloudFile(
-                    id=item['id'],
-                    name=item['name'],
-                    path=f"/{item['name']}",
-                    size=int(item.get('size', 0)),
-                    mime_type=item['mimeType'],
-                    modified_at=datetime.fromisoformat(item['modifiedTime'].replace('Z', '+00:00')),
-                    provider=CloudProvider.GOOGLE_DRIVE,
-                    is_folder=item['mimeType'] == 'application/vnd.google-apps.folder',
-                    parent_id=item.get('parents', [None])[0] if item.get('parents') else None,
-                    download_url=item.get('webContentLink')
-                )
-                files.append(cloud_file)
-            
-            return files
+            return [self._to_cloud_file(item) for item in items]
             
         except Exception as e:
             logger.error(f"Google Drive list files error: {e}")
@@ -218,43 +470,56 @@ class GoogleDriveProvider(BaseCloudProvider):
             from googleapiclient.http import MediaIoBaseDownload
             
             request = self._service.files().get_media(fileId=file_id)
-            file_buffer = io.BytesIO()
-            downloader = MediaIoBaseDownload(file_buffer, request)
+            collector = _ChunkCollector()
+            downloader = MediaIoBaseDownload(collector, request)
             
-            done = False
-            while not done:
-                status, done = downloader.next_chunk()
+            def _download():
+                request.http = self._thread_http()
+                done = False
+                while not done:
+                    status, done = downloader.next_chunk()
             
-            return file_buffer.getvalue()
+            await asyncio.to_thread(_download)
+            
+            # join() hands back a lone chunk as-is, so single-chunk downloads are never copied
+            return b''.join(collector.chunks)
             
         except Exception as e:
             logger.error(f"Google Drive download error: {e}")
             return b''
     
+    async def stream_file(self, file_id: str) -> AsyncIterator[bytes]:
+        """Stream a file from Google Drive, one media chunk at a time"""
+        if not self._initialized:
+            return
+        
+        from googleapiclient.http import MediaIoBaseDownload
+        
+        request = self._service.files().get_media(fileId=file_id)
+        # Chunks may run on different pool threads, so the stream gets a transport of its own
+        request.http = self._new_http()
+        collector = _ChunkCollector()
+        downloader = MediaIoBaseDownload(collector, request, chunksize=self.STREAM_CHUNK_SIZE)
+        
+        done = False
+        while not done:
+            _, done = await asyncio.to_thread(downloader.next_chunk)
+            for chunk in collector.chunks:
+                yield chunk
+            collector.chunks.clear()
+    
     async def get_file_info(self, file_id: str) -> Optional[CloudFile]:
         """Get file metadata from Google Drive"""
         if not self._initialized:
             return None
         
         try:
-            item = self._service.files().get(
-                fileId=file_id,
-                fields="id, name, mimeType, size, modifiedTime, parents, webContentLink"
-            ).execute()
-            
-            return CloudFile(
-                id=item['id'],
-                name=item['name'],
-                path=f"/{item['name']}",
-                size=int(item.get('size', 0)),
-                mime_type=item['mimeType'],
-                modified_at=datetime.fromisoformat(item['modifiedTime'].replace('Z', '+00:00')),
-                provider=CloudProvider.GOOGLE_DRIVE,
-                is_folder=item['mimeType'] == 'application/vnd.google-apps.folder',
-                parent_id=item.get('parents', [None])[0] if item.get('parents') else None,
-                download_url=item.get('webContentLink')
+            item = await self._execute(
+                self._service.files().get(fileId=file_id, fields=f"{self.FILE_FIELDS}, md5Checksum")
             )
             
+            return self._to_cloud_file(item)
+            
         except Exception as e:
             logger.error(f"Google Drive get file info error: {e}")
             return None
@@ -266,72 +531,121 @@ class GoogleDriveProvider(BaseCloudProvider):
             return []
         
         try:
-            search_query = f"name contains '{query}' and trashed=false"
+            search_query = f"name contains '{_drive_literal(query)}' and trashed=false"
             
             if file_types:
-                mime_conditions = []
-                for ft in file_types:
-                    mime_type = self._get_mime_type(ft)
-                    if mime_type:
-                        mime_conditions.append(f"mimeType='{mime_type}'")
+                mime_conditions = _mime_conditions(tuple(file_types))
                 if mime_conditions:
-                    search_query += f" and ({' or '.join(mime_conditions)})"
+                    search_query += f" and {mime_conditions}"
             
-            results = self._service.files().list(
-                q=search_query,
-                pageSize=50,
-                fields="files(id, name, mimeType, size, modifiedTime, parents)"
-            ).execute()
-            
-            files = []
-            for item in results.get('files', []):
-                cloud_file = CloudFile(
-                    id=item['id'],
-                    name=item['name'],
-                    path=f"/{item['name']}",
-                    size=int(item.get('size', 0)),
-                    mime_type=item['mimeType'],
-                    modified_at=datetime.fromisoformat(item['modifiedTime'].replace('Z', '+00:00')),
-                    provider=CloudProvider.GOOGLE_DRIVE,
-                    is_folder=item['mimeType'] == 'application/vnd.google-apps.folder',
-                    parent_id=item.get('parents', [None])[0] if item.get('parents') else None
-                )
-                files.append(cloud_file)
+            items = await asyncio.to_thread(
+                self._list_all, search_query, "id, name, mimeType, size, modifiedTime, parents",
+                self.SEARCH_RESULT_LIMIT
+            )
             
-            return files
+            return [self._to_cloud_file(item) for item in items]
             
         except Exception as e:
             logger.error(f"Google Drive search error: {e}")
             return []
     
-    def _get_mime_type(self, extension: str) -> Optional[str]:
+    async def get_files_info(self, file_ids: List[str]) -> List[Optional[CloudFile]]:
+        """Get metadata for several files, up to BATCH_LIMIT per batch HTTP request"""
+        if not self._initialized:
+            return [None] * len(file_ids)
+        
+        items: Dict[str, Dict[str, Any]] = {}
+        
+        def _collect(request_id, response, exception):
+            if exception is not None:
+                logger.error(f"Google Drive get file info error: {exception}")
+            else:
+                items[request_id] = response
+        
+        try:
+            for start in range(0, len(file_ids), self.BATCH_LIMIT):
+                batch = self._service.new_batch_http_request(callback=_collect)
+                for index in range(start, min(start + self.BATCH_LIMIT, len(file_ids))):
+                    batch.add(
+                        self._service.files().get(fileId=file_ids[index], fields=self.FILE_FIELDS),
+                        request_id=str(index)
+                    )
+                await self._execute(batch)
+                
+        except Exception as e:
+            logger.error(f"Google Drive batch file info error: {e}")
+        
+        return [
+            self._to_cloud_file(items[str(index)]) if str(index) in items else None
+            for index in range(len(file_ids))
+        ]
+    
+    def _to_cloud_file(self, item: Dict[str, Any]) -> CloudFile:
+        """Build a CloudFile from a Drive files resource"""
+        return CloudFile(
+            id=item['id'],
+            name=item['name'],
+            path=f"/{item['name']}",
+            size=int(item.get('size', 0)),
+            mime_type=item['mimeType'],
+            modified_at=_parse_timestamp(item['modifiedTime']),
+            provider=CloudProvider.GOOGLE_DRIVE,
+            is_folder=item['mimeType'] == 'application/vnd.google-apps.folder',
+            parent_id=item.get('parents', [None])[0] if item.get('parents') else None,
+            download_url=item.get('webContentLink'),
+            metadata={'etag': item['md5Checksum']} if 'md5Checksum' in item else None
+        )
+    
+    def _new_http(self):
+        """Build an authorized httplib2 transport sharing the provider's credentials"""
+        import httplib2
+        from google_auth_httplib2 import AuthorizedHttp
+        return AuthorizedHttp(self._creds, http=httplib2.Http())
+    
+    def _thread_http(self):
+        """Transport for the calling worker thread (httplib2 connections are not thread-safe)"""
+        http = getattr(self._local, 'http', None)
+        if http is None:
+            http = self._local.http = self._new_http()
+        return http
+    
+    async def _execute(self, request) -> Any:
+        """Run a googleapiclient request or batch in a worker thread"""
+        return await asyncio.to_thread(lambda: request.execute(http=self._thread_http()))
+    
+    def _list_all(self, query: str, fields: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Run a files().list query, following nextPageToken until every page (or limit items) is read (blocking)"""
+        items = []
+        page_token = None
+        while True:
+            results = self._service.files().list(
+                q=query,
+                pageSize=min(self.PAGE_SIZE, limit - len(items)) if limit else self.PAGE_SIZE,
+                pageToken=page_token,
+                fields=f"nextPageToken, files({fields})"
+            ).execute(http=self._thread_http())
+            items.extend(results.get('files', []))
+            page_token = results.get('nextPageToken')
+            if not page_token or (limit and len(items) >= limit):
+                return items[:limit] if limit else items
+    
+    @staticmethod
+    def _get_mime_type(extension: str) -> Optional[str]:
         """Map file extension to MIME type"""
-        mime_map = {
-            'pdf': 'application/pdf',
-            'docx': 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
-            'doc': 'application/msword',
-            'txt': 'text/plain',
-            'jpg': 'image/jpeg',
-            'jpeg': 'image/jpeg',
-            'png': 'image/png',
-            'mp3': 'audio/mpeg',
-            'wav': 'audio/wav',
-            'm4a': 'audio/mp4',
-        }
-        return mime_map.get(extension.lower())
+        return _MIME_MAP.get(extension.lower())
 
 
 class OneDriveProvider(BaseCloudProvider):
     """Microsoft OneDrive integration"""
     
     GRAPH_API_URL = "https://graph.microsoft.com/v1.0"
+    BATCH_LIMIT = 20  # Graph JSON $batch maximum requests per call
+    TOKEN_URL = "https://login.microsoftonline.com/common/oauth2/v2.0/token"
     
     async def initialize(self) -> bool:
         """Initialize OneDrive connection"""
         try:
-            try:
-                import aiohttp
-            except ImportError:
+            if aiohttp is None:
                 logger.warning("aiohttp not installed. Install with: pip install aiohttp")
                 return False
             
@@ -344,24 +658,51 @@ class OneDriveProvider(BaseCloudProvider):
                 "Content-Type": "application/json"
             }
             
+            # One session for the provider's lifetime keeps connections alive across calls
+            self._session = self._create_session()
+            
             # Test connection
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    f"{self.GRAPH_API_URL}/me/drive",
-                    headers=self._headers
-                ) as response:
-                    if response.status == 200:
-                        self._initialized = True
-                        logger.info("OneDrive provider initialized successfully")
-                        return True
-                    else:
-                        logger.error(f"OneDrive auth failed: {response.status}")
-                        return False
-                        
+            async with self._session.get(
+                f"{self.GRAPH_API_URL}/me/drive",
+                headers=self._headers
+            ) as response:
+                if response.status == 200:
+                    self._initialized = True
+                    self._start_token_refresh()
+                    logger.info("OneDrive provider initialized successfully")
+                    return True
+                else:
+                    logger.error(f"OneDrive auth failed: {response.status}")
+                    await self.close()
+                    return False
+                    
         except Exception as e:
             logger.error(f"Failed to initialize OneDrive: {e}")
+            await self.close()
             return False
     
+    async def _refresh_token(self) -> bool:
+        """Refresh the OneDrive OAuth token with the stored refresh token"""
+        form = {
+            "grant_type": "refresh_token",
+            "refresh_token": self.credentials.refresh_token,
+            "client_id": self.credentials.api_key,
+        }
+        if self.credentials.api_secret:
+            form["client_secret"] = self.credentials.api_secret
+        
+        async with self._session.post(self.TOKEN_URL, data=form) as response:
+            if response.status != 200:
+                logger.error(f"OneDrive token refresh failed: {response.status}")
+                return False
+            token = orjson.loads(await response.read())
+        
+        self.credentials.access_token = token["access_token"]
+        self.credentials.refresh_token = token.get("refresh_token", self.credentials.refresh_token)
+        self.credentials.expires_at = datetime.utcnow() + timedelta(seconds=int(token.get("expires_in", 3600)))
+        self._headers["Authorization"] = f"Bearer {self.credentials.access_token}"
+        return True
+    
     async def list_files(self, folder_id: Optional[str] = None,
                          file_types: Optional[List[str]] = None) -> List[CloudFile]:
         """List files in OneDrive folder"""
@@ -369,98 +710,158 @@ class OneDriveProvider(BaseCloudProvider):
             return []
         
         try:
-            import aiohttp
-            
+            allowed = _extension_filter(file_types)
             if folder_id:
                 url = f"{self.GRAPH_API_URL}/me/drive/items/{folder_id}/children"
             else:
                 url = f"{self.GRAPH_API_URL}/me/drive/root/children"
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=self._headers) as response:
+            files = []
+            
+            # Follow @odata.nextLink until the whole folder has been read
+            while url:
+                async with self._session.get(url, headers=self._headers) as response:
                     if response.status != 200:
-                        return []
-                    
-                    data = await response.json()
-                    files = []
+                        break
                     
-                    for item in data.get('value', []):
-                        # Filter by file type if specified
-                        if file_types and 'file' in item:
-                            ext = Path(item['name']).suffix.lower().lstrip('.')
-                            if ext not in file_types:
-                                continue
-                        
-                        cloud_file = CloudFile(
-                            id=item['id'],
-                            name=item['name'],
-                            path=item.get('parentReference', {}).get('path', '') + '/' + item['name'],
-                            size=item.get('size', 0),
-                            mime_type=item.get('file', {}).get('mimeType', 'application/octet-stream'),
-                            modified_at=datetime.fromisoformat(item['lastModifiedDateTime'].replace('Z', '+00:00')),
-                            provider=CloudProvider.ONEDRIVE,
-                            is_folder='folder' in item,
-                            parent_id=item.get('parentReference', {}).get('id'),
-                            download_url=item.get('@microsoft.graph.downloadUrl')
-                        )
-                        files.append(cloud_file)
-                    
-                    return files
+                    data = orjson.loads(await response.read())
+                
+                for item in data.get('value', []):
+                    # Filter by file type if specified
+                    if allowed and 'file' in item:
+                        ext = Path(item['name']).suffix.lower().lstrip('.')
+                        if ext not in allowed:
+                            continue
                     
+                    files.append(self._to_cloud_file(item))
+                
+                url = data.get('@odata.nextLink')
+            
+            return files
+                
         except Exception as e:
             logger.error(f"OneDrive list files error: {e}")
             return []
     
+    async def _fetch_download_url(self, file_id: str) -> Optional[str]:
+        """Get the item's pre-authenticated CDN link"""
+        url = f"{self.GRAPH_API_URL}/me/drive/items/{file_id}?select=id,@microsoft.graph.downloadUrl"
+        async with self._session.get(url, headers=self._headers) as response:
+            if response.status != 200:
+                return None
+            return orjson.loads(await response.read()).get('@microsoft.graph.downloadUrl')
+    
+    async def download_files(self, file_ids: List[str]) -> List[bytes]:
+        """Download several files, resolving their CDN links in Graph $batch calls first"""
+        if self._initialized:
+            missing = [fid for fid in dict.fromkeys(file_ids) if not self._cached_download_url(fid)]
+            await asyncio.gather(*(
+                self._batch_fetch_download_urls(missing[start:start + self.BATCH_LIMIT])
+                for start in range(0, len(missing), self.BATCH_LIMIT)
+            ))
+        return await super().download_files(file_ids)
+    
+    async def _batch_fetch_download_urls(self, file_ids: List[str]):
+        """Resolve up to BATCH_LIMIT download links with one $batch request.
+        
+        $batch does not follow the /content redirect, so it can't return file bodies;
+        files it fails to resolve fall back to per-file lookups in download_file.
+        """
+        payload = {
+            "requests": [
+                {
+                    "id": str(index),
+                    "method": "GET",
+                    "url": f"/me/drive/items/{file_id}?select=id,@microsoft.graph.downloadUrl"
+                }
+                for index, file_id in enumerate(file_ids)
+            ]
+        }
+        try:
+            async with self._session.post(
+                f"{self.GRAPH_API_URL}/$batch",
+                headers=self._headers,
+                json=payload
+            ) as response:
+                if response.status != 200:
+                    logger.warning(f"OneDrive batch link lookup failed: HTTP {response.status}")
+                    return
+                data = orjson.loads(await response.read())
+        except Exception as e:
+            logger.warning(f"OneDrive batch link lookup error: {e}")
+            return
+        
+        for item in data.get('responses', []):
+            if item.get('status') == 200:
+                self._remember_download_url(
+                    file_ids[int(item['id'])],
+                    item.get('body', {}).get('@microsoft.graph.downloadUrl')
+                )
+    
     async def download_file(self, file_id: str) -> bytes:
         """Download a file from OneDrive"""
         if not self._initialized:
             return b''
         
         try:
-            import aiohttp
+            # The CDN link needs no Authorization header and skips the Graph content endpoint
+            link = await self._get_download_url(file_id)
+            if link:
+                async with self._session.get(link) as response:
+                    if response.status == 200:
+                        return await response.read()
+                self._download_urls.pop(file_id, None)
             
             url = f"{self.GRAPH_API_URL}/me/drive/items/{file_id}/content"
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=self._headers) as response:
-                    if response.status == 200:
-                        return await response.read()
-                    return b''
-                    
+            async with self._session.get(url, headers=self._headers) as response:
+                if response.status == 200:
+                    return await response.read()
+                return b''
+                
         except Exception as e:
             logger.error(f"OneDrive download error: {e}")
             return b''
     
+    async def stream_file(self, file_id: str) -> AsyncIterator[bytes]:
+        """Stream a file from OneDrive"""
+        if not self._initialized:
+            return
+        
+        link = await self._get_download_url(file_id)
+        if link:
+            async with self._session.get(link) as response:
+                if response.status == 200:
+                    async for chunk in response.content.iter_chunked(self.STREAM_CHUNK_SIZE):
+                        yield chunk
+                    return
+            self._download_urls.pop(file_id, None)
+        
+        url = f"{self.GRAPH_API_URL}/me/drive/items/{file_id}/content"
+        
+        async with self._session.get(url, headers=self._headers) as response:
+            if response.status != 200:
+                logger.error(f"OneDrive download error: HTTP {response.status}")
+                return
+            async for chunk in response.content.iter_chunked(self.STREAM_CHUNK_SIZE):
+                yield chunk
+    
     async def get_file_info(self, file_id: str) -> Optional[CloudFile]:
         """Get file metadata from OneDrive"""
         if not self._initialized:
             return None
         
         try:
-            import aiohttp
-            
             url = f"{self.GRAPH_API_URL}/me/drive/items/{file_id}"
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=self._headers) as response:
-                    if response.status != 200:
-                        return None
-                    
-                    item = await response.json()
-                    
-                    return CloudFile(
-                        id=item['id'],
-                        name=item['name'],
-                        path=item.get('parentReference', {}).get('path', '') + '/' + item['name'],
-                        size=item.get('size', 0),
-                        mime_type=item.get('file', {}).get('mimeType', 'application/octet-stream'),
-                        modified_at=datetime.fromisoformat(item['lastModifiedDateTime'].replace('Z', '+00:00')),
-                        provider=CloudProvider.ONEDRIVE,
-                        is_folder='folder' in item,
-                        parent_id=item.get('parentReference', {}).get('id'),
-                        download_url=item.get('@microsoft.graph.downloadUrl')
-                    )
-                    
+            async with self._session.get(url, headers=self._headers) as response:
+                if response.status != 200:
+                    return None
+                
+                item = orjson.loads(await response.read())
+                
+                return self._to_cloud_file(item)
+                
         except Exception as e:
             logger.error(f"OneDrive get file info error: {e}")
             return None
@@ -472,53 +873,67 @@ class OneDriveProvider(BaseCloudProvider):
             return []
         
         try:
-            import aiohttp
+            allowed = _extension_filter(file_types)
+            url = f"{self.GRAPH_API_URL}/me/drive/root/search(q='{_odata_literal(query)}')"
             
-            url = f"{self.GRAPH_API_URL}/me/drive/root/search(q='{query}')"
-            
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, headers=self._headers) as response:
-                    if response.status != 200:
-                        return []
-                    
-                    data = await response.json()
-                    files = []
-                    
-                    for item in data.get('value', []):
-                        if file_types and 'file' in item:
-                            ext = Path(item['name']).suffix.lower().lstrip('.')
-                            if ext not in file_types:
-                                continue
-                        
-                        cloud_file = CloudFile(
-                            id=item['id'],
-                            name=item['name'],
-                            path=item.get('parentReference', {}).get('path', '') + '/' + item['name'],
-                            size=item.get('size', 0),
-                            mime_type=item.get('file', {}).get('mimeType', 'application/octet-stream'),
-                            modified_at=datetime.fromisoformat(item['lastModifiedDateTime'].replace('Z', '+00:00')),
-                            provider=CloudProvider.ONEDRIVE,
-                            is_folder='folder' in item,
-                            parent_id=item.get('parentReference', {}).get('id')
-                        )
-                        files.append(cloud_file)
-                    
-                    return files
+            async with self._session.get(url, headers=self._headers) as response:
+                if response.status != 200:
+                    return []
+                
+                data = orjson.loads(await response.read())
+                files = []
+                
+                for item in data.get('value', []):
+                    if allowed and 'file' in item:
+                        ext = Path(item['name']).suffix.lower().lstrip('.')
+                        if ext not in allowed:
+                            continue
                     
+                    files.append(self._to_cloud_file(item))
+                
+                return files
+                
         except Exception as e:
             logger.error(f"OneDrive search error: {e}")
             return []
+    
+    def _to_cloud_file(self, item: Dict[str, Any]) -> CloudFile:
+        """Build a CloudFile from a Graph driveItem, caching its download link"""
+        parent_ref = item.get('parentReference') or _EMPTY
+        cloud_file = CloudFile(
+            id=item['id'],
+            name=item['name'],
+            path=f"{parent_ref.get('path', '')}/{item['name']}",
+            size=item.get('size', 0),
+            mime_type=(item.get('file') or _EMPTY).get('mimeType', 'application/octet-stream'),
+            modified_at=_parse_timestamp(item['lastModifiedDateTime']),
+            provider=CloudProvider.ONEDRIVE,
+            is_folder='folder' in item,
+            parent_id=parent_ref.get('id'),
+            download_url=item.get('@microsoft.graph.downloadUrl'),
+            metadata={'etag': item['cTag']} if 'cTag' in item else None
+        )
+        self._remember_download_url(cloud_file.id, cloud_file.download_url)
+        return cloud_file
 
 
 class AWSS3Provider(BaseCloudProvider):
     """AWS S3 integration"""
     
+    LIST_PAGE_SIZE = 1000  # list_objects_v2 maximum keys per page
+    # Objects above the threshold are fetched as parallel ranged GETs
+    MULTIPART_THRESHOLD = 16 * 1024 * 1024
+    PART_SIZE = 8 * 1024 * 1024
+    MAX_CONCURRENT_PARTS = 8
+    
+    def __init__(self, credentials: CloudCredentials, connector=None):
+        super().__init__(credentials, connector)
+        self._part_semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_PARTS)
+    
     async def initialize(self) -> bool:
         """Initialize AWS S3 connection"""
         try:
-            try:
-                import boto3
-            except ImportError:
+            if boto3 is None:
                 logger.warning("boto3 not installed. Install with: pip install boto3")
                 return False
             
@@ -534,13 +949,15 @@ class AWSS3Provider(BaseCloudProvider):
                 's3',
                 aws_access_key_id=self.credentials.aws_access_key_id,
                 aws_secret_access_key=self.credentials.aws_secret_access_key,
-                region_name=self.credentials.aws_region or 'us-east-1'
+                region_name=self.credentials.aws_region or 'us-east-1',
+                # Enough pooled connections for concurrent downloads plus ranged part fetches
+                config=BotoConfig(max_pool_connections=self.MAX_CONCURRENT_DOWNLOADS + self.MAX_CONCURRENT_PARTS)
             )
             
             self._bucket = self.credentials.s3_bucket
             
-            # Test connection
-            self._s3.head_bucket(Bucket=self._bucket)
+            # Test connection (boto3 is blocking - keep its round trips off the event loop)
+            await asyncio.to_thread(self._s3.head_bucket, Bucket=self._bucket)
             
             self._initialized = True
             logger.info("AWS S3 provider initialized successfully")
@@ -557,67 +974,111 @@ class AWSS3Provider(BaseCloudProvider):
             return []
         
         try:
+            allowed = _extension_filter(file_types)
             prefix = folder_id or ""
             
-            response = self._s3.list_objects_v2(
-                Bucket=self._bucket,
-                Prefix=prefix,
-                MaxKeys=100
-            )
-            
-            files = []
-            for obj in response.get('Contents', []):
-                key = obj['Key']
-                name = key.split('/')[-1]
-                
-                if not name:  # Skip folder markers
-                    continue
-                
-                # Filter by file type
-                if file_types:
-                    ext = Path(name).suffix.lower().lstrip('.')
-                    if ext not in file_types:
-                        continue
-                
-                cloud_file = CloudFile(
-                    id=key,
-                    name=name,
-                    path=f"/{key}",
-                    size=obj['Size'],
-                    mime_type=self._guess_mime_type(name),
-                    modified_at=obj['LastModified'].replace(tzinfo=None),
-                    provider=CloudProvider.AWS_S3,
-                    is_folder=key.endswith('/'),
-                    parent_id=folder_id
-                )
-                files.append(cloud_file)
-            
-            return files
+            # The whole paginated listing runs in one worker thread
+            objects = await asyncio.to_thread(self._list_objects, prefix)
+            return self._objects_to_files(objects, allowed, folder_id)
             
         except Exception as e:
             logger.error(f"S3 list files error: {e}")
             return []
     
+    def _objects_to_files(self, objects: List[Dict[str, Any]], allowed: Optional[frozenset],
+                          folder_id: Optional[str] = None) -> List[CloudFile]:
+        """Convert list_objects_v2 entries to CloudFiles, skipping folder markers and filtered types"""
+        files = []
+        for obj in objects:
+            key = obj['Key']
+            name = key.split('/')[-1]
+            
+            if not name:  # Skip folder markers
+                continue
+            
+            # Filter by file type
+            if allowed:
+                ext = Path(name).suffix.lower().lstrip('.')
+                if ext not in allowed:
+                    continue
+            
+            files.append(CloudFile(
+                id=key,
+                name=name,
+                path=f"/{key}",
+                size=obj['Size'],
+                mime_type=self._guess_mime_type(name),
+                modified_at=obj['LastModified'].replace(tzinfo=None),
+                provider=CloudProvider.AWS_S3,
+                is_folder=key.endswith('/'),
+                parent_id=folder_id
+            ))
+        return files
+    
+    def _list_objects(self, prefix: str, max_items: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Fetch every object (or the first max_items) under a prefix (blocking; call via asyncio.to_thread)"""
+        paginator = self._s3.get_paginator('list_objects_v2')
+        pagination = {'PageSize': self.LIST_PAGE_SIZE}
+        if max_items:
+            pagination['MaxItems'] = max_items
+        objects = []
+        for page in paginator.paginate(
+            Bucket=self._bucket,
+            Prefix=prefix,
+            PaginationConfig=pagination
+        ):
+            objects.extend(page.get('Contents', []))
+        return objects
+    
     async def download_file(self, file_id: str) -> bytes:
         """Download a file from S3"""
         if not self._initialized:
             return b''
         
         try:
-            response = self._s3.get_object(Bucket=self._bucket, Key=file_id)
-            return response['Body'].read()
+            head = await asyncio.to_thread(self._s3.head_object, Bucket=self._bucket, Key=file_id)
+            size = head['ContentLength']
+            if size <= self.MULTIPART_THRESHOLD:
+                return await asyncio.to_thread(self._get_object_bytes, file_id)
+            
+            # Fill a preallocated buffer from parallel ranged GETs
+            buffer = bytearray(size)
+            offset = 0
+            async for part in self._stream_parts(file_id, size, head['ETag']):
+                buffer[offset:offset + len(part)] = part
+                offset += len(part)
+            return bytes(buffer)
             
         except Exception as e:
             logger.error(f"S3 download error: {e}")
             return b''
     
+    async def stream_file(self, file_id: str) -> AsyncIterator[bytes]:
+        """Stream an object from S3, reading the body in worker threads"""
+        if not self._initialized:
+            return
+        
+        head = await asyncio.to_thread(self._s3.head_object, Bucket=self._bucket, Key=file_id)
+        if head['ContentLength'] > self.MULTIPART_THRESHOLD:
+            async for part in self._stream_parts(file_id, head['ContentLength'], head['ETag']):
+                yield part
+            return
+        
+        response = await asyncio.to_thread(self._s3.get_object, Bucket=self._bucket, Key=file_id)
+        body = response['Body']
+        try:
+            while chunk := await asyncio.to_thread(body.read, self.STREAM_CHUNK_SIZE):
+                yield chunk
+        finally:
+            body.close()
+    
     async def get_file_info(self, file_id: str) -> Optional[CloudFile]:
         """Get file metadata from S3"""
         if not self._initialized:
             return None
         
         try:
-            response = self._s3.head_object(Bucket=self._bucket, Key=file_id)
+            response = await asyncio.to_thread(self._s3.head_object, Bucket=self._bucket, Key=file_id)
             name = file_id.split('/')[-1]
             
             return CloudFile(
@@ -629,7 +1090,8 @@ class AWSS3Provider(BaseCloudProvider):
                 modified_at=response['LastModified'].replace(tzinfo=None),
                 provider=CloudProvider.AWS_S3,
                 is_folder=False,
-                parent_id='/'.join(file_id.split('/')[:-1]) or None
+                parent_id='/'.join(file_id.split('/')[:-1]) or None,
+                metadata={'etag': response['ETag']} if 'ETag' in response else None
             )
             
         except Exception as e:
@@ -642,17 +1104,53 @@ class AWSS3Provider(BaseCloudProvider):
         if not self._initialized:
             return []
         
-        # S3 doesn't have true search, so we list and filter
-        all_files = await self.list_files(file_types=file_types)
+        # S3 doesn't have true search, so we filter one page of keys rather than the whole bucket
+        try:
+            allowed = _extension_filter(file_types)
+            objects = await asyncio.to_thread(self._list_objects, "", self.LIST_PAGE_SIZE)
+        except Exception as e:
+            logger.error(f"S3 search error: {e}")
+            return []
         
         query_lower = query.lower()
-        return [f for f in all_files if query_lower in f.name.lower()]
+        files = [f for f in self._objects_to_files(objects, allowed) if query_lower in f.name.lower()]
+        return files[:self.SEARCH_RESULT_LIMIT]
+    
+    async def _stream_parts(self, file_id: str, size: int, etag: str) -> AsyncIterator[bytes]:
+        """Yield an object's PART_SIZE ranges in order, fetching up to MAX_CONCURRENT_PARTS ahead"""
+        async def _fetch(start: int) -> bytes:
+            end = min(start + self.PART_SIZE, size) - 1
+            async with self._part_semaphore:
+                return await asyncio.to_thread(self._get_range_bytes, file_id, start, end, etag)
+        
+        starts = iter(range(0, size, self.PART_SIZE))
+        window = deque(asyncio.ensure_future(_fetch(start)) for start in islice(starts, self.MAX_CONCURRENT_PARTS))
+        try:
+            while window:
+                part = await window.popleft()
+                next_start = next(starts, None)
+                if next_start is not None:
+                    window.append(asyncio.ensure_future(_fetch(next_start)))
+                yield part
+        finally:
+            for task in window:
+                task.cancel()
+    
+    def _get_object_bytes(self, file_id: str) -> bytes:
+        """Fetch an object's body (blocking; run in a worker thread)"""
+        response = self._s3.get_object(Bucket=self._bucket, Key=file_id)
+        return response['Body'].read()
+    
+    def _get_range_bytes(self, file_id: str, start: int, end: int, etag: str) -> bytes:
+        """Fetch bytes start..end (inclusive) of an object, failing if it changed since HEAD"""
+        response = self._s3.get_object(
+            Bucket=self._bucket, Key=file_id, Range=f"bytes={start}-{end}", IfMatch=etag
+        )
+        return response['Body'].read()
     
     def _guess_mime_type(self, filename: str) -> str:
         """Guess MIME type from filename"""
-        import mimetypes
-        mime_type, _ = mimetypes.guess_type(filename)
-        return mime_type or 'application/octet-stream'
+        return _guess_mime_type(filename)
 
 
 class DropboxProvider(BaseCloudProvider):
@@ -660,13 +1158,13 @@ class DropboxProvider(BaseCloudProvider):
     
     API_URL = "https://api.dropboxapi.com/2"
     CONTENT_URL = "https://content.dropboxapi.com/2"
+    LIST_LIMIT = 2000  # list_folder maximum entries per page
+    TOKEN_URL = "https://api.dropboxapi.com/oauth2/token"
     
     async def initialize(self) -> bool:
         """Initialize Dropbox connection"""
         try:
-            try:
-                import aiohttp
-            except ImportError:
+            if aiohttp is None:
                 logger.warning("aiohttp not installed. Install with: pip install aiohttp")
                 return False
             
@@ -679,24 +1177,51 @@ class DropboxProvider(BaseCloudProvider):
                 "Content-Type": "application/json"
             }
             
+            # One session for the provider's lifetime keeps connections alive across calls
+            self._session = self._create_session()
+            
             # Test connection
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.API_URL}/users/get_current_account",
-                    headers=self._headers
-                ) as response:
-                    if response.status == 200:
-                        self._initialized = True
-                        logger.info("Dropbox provider initialized successfully")
-                        return True
-                    else:
-                        logger.error(f"Dropbox auth failed: {response.status}")
-                        return False
-                        
+            async with self._session.post(
+                f"{self.API_URL}/users/get_current_account",
+                headers=self._headers
+            ) as response:
+                if response.status == 200:
+                    self._initialized = True
+                    self._start_token_refresh()
+                    logger.info("Dropbox provider initialized successfully")
+                    return True
+                else:
+                    logger.error(f"Dropbox auth failed: {response.status}")
+                    await self.close()
+                    return False
+                    
         except Exception as e:
             logger.error(f"Failed to initialize Dropbox: {e}")
+            await self.close()
             return False
     
+    async def _refresh_token(self) -> bool:
+        """Refresh the Dropbox OAuth token with the stored refresh token"""
+        form = {
+            "grant_type": "refresh_token",
+            "refresh_token": self.credentials.refresh_token,
+            "client_id": self.credentials.api_key,
+        }
+        if self.credentials.api_secret:
+            form["client_secret"] = self.credentials.api_secret
+        
+        async with self._session.post(self.TOKEN_URL, data=form) as response:
+            if response.status != 200:
+                logger.error(f"Dropbox token refresh failed: {response.status}")
+                return False
+            token = orjson.loads(await response.read())
+        
+        self.credentials.access_token = token["access_token"]
+        self.credentials.refresh_token = token.get("refresh_token", self.credentials.refresh_token)
+        self.credentials.expires_at = datetime.utcnow() + timedelta(seconds=int(token.get("expires_in", 3600)))
+        self._headers["Authorization"] = f"Bearer {self.credentials.access_token}"
+        return True
+    
     async def list_files(self, folder_id: Optional[str] = None,
                          file_types: Optional[List[str]] = None) -> List[CloudFile]:
         """List files in Dropbox folder"""
@@ -704,108 +1229,124 @@ class DropboxProvider(BaseCloudProvider):
             return []
         
         try:
-            import aiohttp
-            
+            allowed = _extension_filter(file_types)
             path = folder_id or ""
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.API_URL}/files/list_folder",
-                    headers=self._headers,
-                    json={"path": path, "limit": 100}
-                ) as response:
+            files = []
+            endpoint = f"{self.API_URL}/files/list_folder"
+            body = {"path": path, "limit": self.LIST_LIMIT}
+            
+            # Page with list_folder/continue while Dropbox reports has_more
+            while True:
+                async with self._session.post(endpoint, headers=self._headers, json=body) as response:
                     if response.status != 200:
-                        return []
-                    
-                    data = await response.json()
-                    files = []
-                    
-                    for entry in data.get('entries', []):
-                        # Filter by file type
-                        if file_types and entry['.tag'] == 'file':
-                            ext = Path(entry['name']).suffix.lower().lstrip('.')
-                            if ext not in file_types:
-                                continue
-                        
-                        cloud_file = CloudFile(
-                            id=entry.get('id', entry['path_lower']),
-                            name=entry['name'],
-                            path=entry['path_display'],
-                            size=entry.get('size', 0),
-                            mime_type=self._guess_mime_type(entry['name']),
-                            modified_at=datetime.fromisoformat(
-                                entry.get('server_modified', datetime.now().isoformat()).replace('Z', '+00:00')
-                            ) if 'server_modified' in entry else datetime.now(),
-                            provider=CloudProvider.DROPBOX,
-                            is_folder=entry['.tag'] == 'folder',
-                            parent_id=folder_id
-                        )
-                        files.append(cloud_file)
+                        break
                     
-                    return files
+                    data = orjson.loads(await response.read())
+                
+                for entry in data.get('entries', []):
+                    # Filter by file type
+                    if allowed and entry['.tag'] == 'file':
+                        ext = Path(entry['name']).suffix.lower().lstrip('.')
+                        if ext not in allowed:
+                            continue
                     
+                    files.append(self._to_cloud_file(entry, parent_id=folder_id))
+                
+                if not data.get('has_more'):
+                    break
+                endpoint = f"{self.API_URL}/files/list_folder/continue"
+                body = {"cursor": data['cursor']}
+            
+            return files
+                
         except Exception as e:
             logger.error(f"Dropbox list files error: {e}")
             return []
     
+    async def _fetch_download_url(self, file_id: str) -> Optional[str]:
+        """Get a temporary direct link (served from dl.dropboxusercontent.com)"""
+        async with self._session.post(
+            f"{self.API_URL}/files/get_temporary_link",
+            headers=self._headers,
+            json={"path": file_id}
+        ) as response:
+            if response.status != 200:
+                return None
+            return orjson.loads(await response.read()).get('link')
+    
     async def download_file(self, file_id: str) -> bytes:
         """Download a file from Dropbox"""
         if not self._initialized:
             return b''
         
         try:
-            import aiohttp
+            link = await self._get_download_url(file_id)
+            if link:
+                async with self._session.get(link) as response:
+                    if response.status == 200:
+                        return await response.read()
+                self._download_urls.pop(file_id, None)
             
             headers = {
                 "Authorization": f"Bearer {self.credentials.access_token}",
                 "Dropbox-API-Arg": json.dumps({"path": file_id})
             }
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.CONTENT_URL}/files/download",
-                    headers=headers
-                ) as response:
-                    if response.status == 200:
-                        return await response.read()
-                    return b''
-                    
+            async with self._session.post(
+                f"{self.CONTENT_URL}/files/download",
+                headers=headers
+            ) as response:
+                if response.status == 200:
+                    return await response.read()
+                return b''
+                
         except Exception as e:
             logger.error(f"Dropbox download error: {e}")
             return b''
     
+    async def stream_file(self, file_id: str) -> AsyncIterator[bytes]:
+        """Stream a file from Dropbox"""
+        if not self._initialized:
+            return
+        
+        link = await self._get_download_url(file_id)
+        if link:
+            async with self._session.get(link) as response:
+                if response.status == 200:
+                    async for chunk in response.content.iter_chunked(self.STREAM_CHUNK_SIZE):
+                        yield chunk
+                    return
+            self._download_urls.pop(file_id, None)
+        
+        headers = {
+            "Authorization": f"Bearer {self.credentials.access_token}",
+            "Dropbox-API-Arg": json.dumps({"path": file_id})
+        }
+        
+        async with self._session.post(f"{self.CONTENT_URL}/files/download", headers=headers) as response:
+            if response.status != 200:
+                logger.error(f"Dropbox download error: HTTP {response.status}")
+                return
+            async for chunk in response.content.iter_chunked(self.STREAM_CHUNK_SIZE):
+                yield chunk
+    
     async def get_file_info(self, file_id: str) -> Optional[CloudFile]:
         """Get file metadata from Dropbox"""
         if not self._initialized:
             return None
         
         try:
-            import aiohttp
-            
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.API_URL}/files/get_metadata",
-                    headers=self._headers,
-                    json={"path": file_id}
-                ) as response:
-                    if response.status != 200:
-                        return None
-                    
-                    entry = await response.json()
-                    
-                    return CloudFile(
-                        id=entry.get('id', entry['path_lower']),
-                        name=entry['name'],
-                        path=entry['path_display'],
-                        size=entry.get('size', 0),
-                        mime_type=self._guess_mime_type(entry['name']),
-                        modified_at=datetime.fromisoformat(
-                            entry.get('server_modified', datetime.now().isoformat()).replace('Z', '+00:00')
-                        ) if 'server_modified' in entry else datetime.now(),
-                        provider=CloudProvider.DROPBOX,
-                        is_folder=entry['.tag'] == 'folder'
-                    )
-                    
+            async with self._session.post(
+                f"{self.API_URL}/files/get_metadata",
+                headers=self._headers,
+                json={"path": file_id}
+            ) as response:
+                if response.status != 200:
+                    return None
+                
+                return self._to_cloud_file(orjson.loads(await response.read()))
+                
         except Exception as e:
             logger.error(f"Dropbox get file info error: {e}")
             return None
@@ -817,8 +1358,6 @@ class DropboxProvider(BaseCloudProvider):
             return []
         
         try:
-            import aiohttp
-            
             search_options = {
                 "path": "",
                 "query": query,
@@ -831,53 +1370,77 @@ class DropboxProvider(BaseCloudProvider):
             if file_types:
                 search_options["options"]["file_extensions"] = file_types
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.API_URL}/files/search_v2",
-                    headers=self._headers,
-                    json=search_options
-                ) as response:
-                    if response.status != 200:
-                        return []
-                    
-                    data = await response.json()
-                    files = []
-                    
-                    for match in data.get('matches', []):
-                        entry = match.get('metadata', {}).get('metadata', {})
-                        if not entry:
-                            continue
-                        
-                        cloud_file = CloudFile(
-                            id=entry.get('id', entry.get('path_lower', '')),
-                            name=entry.get('name', ''),
-                            path=entry.get('path_display', ''),
-                            size=entry.get('size', 0),
-                            mime_type=self._guess_mime_type(entry.get('name', '')),
-                            modified_at=datetime.fromisoformat(
-                                entry.get('server_modified', datetime.now().isoformat()).replace('Z', '+00:00')
-                            ) if 'server_modified' in entry else datetime.now(),
-                            provider=CloudProvider.DROPBOX,
-                            is_folder=entry.get('.tag') == 'folder'
-                        )
-                        files.append(cloud_file)
-                    
-                    return files
+            async with self._session.post(
+                f"{self.API_URL}/files/search_v2",
+                headers=self._headers,
+                json=search_options
+            ) as response:
+                if response.status != 200:
+                    return []
+                
+                data = orjson.loads(await response.read())
+                files = []
+                
+                for match in data.get('matches', []):
+                    entry = match.get('metadata', {}).get('metadata', {})
+                    if not entry:
+                        continue
                     
+                    files.append(self._to_cloud_file(entry))
+                
+                return files
+                
         except Exception as e:
             logger.error(f"Dropbox search error: {e}")
             return []
     
+    def _to_cloud_file(self, entry: Dict[str, Any], parent_id: Optional[str] = None) -> CloudFile:
+        """Build a CloudFile from Dropbox file/folder metadata"""
+        name = entry.get('name', '')
+        server_modified = entry.get('server_modified')
+        content_hash = entry.get('content_hash')
+        return CloudFile(
+            id=entry.get('id') or entry.get('path_lower', ''),
+            name=name,
+            path=entry.get('path_display', ''),
+            size=entry.get('size', 0),
+            mime_type=self._guess_mime_type(name),
+            modified_at=_parse_timestamp(server_modified) if server_modified else datetime.now(),
+            provider=CloudProvider.DROPBOX,
+            is_folder=entry.get('.tag') == 'folder',
+            parent_id=parent_id,
+            metadata={'etag': content_hash} if content_hash else None
+        )
+    
     def _guess_mime_type(self, filename: str) -> str:
         """Guess MIME type from filename"""
-        import mimetypes
-        mime_type, _ = mimetypes.guess_type(filename)
-        return mime_type or 'application/octet-stream'
+        return _guess_mime_type(filename)
+
+
+# Demo payloads served by MockCloudProvider.download_file
+# A minimal PDF header/content (though it won't be a real readable PDF)
+_DEMO_PDF = b"%PDF-1.4\n1 0 obj\n<<\n/Type /Catalog\n/Pages 2 0 R\n>>\nendobj\n2 0 obj\n<<\n/Type /Pages\n/Kids [3 0 R]\n/Count 1\n>>\nendobj\n3 0 obj\n<<\n/Type /Page\n/MediaBox [0 0 595 842]\n/Resources <<\n/Font <<\n/F1 4 0 R\n>>\n>>\n/Contents 5 0 R\n>>\nendobj\n4 0 obj\n<<\n/Type /Font\n/Subtype /Type1\n/Name /F1\n/BaseFont /Helvetica\n>>\nendobj\n5 0 obj\n<<\n/Length 44\n>>\nstream\nBT\n/F1 24 Tf\n100 700 Td\n(This is a demo PDF file from Cloud Storage) Tj\nET\nendstream\nendobj\nxref\n0 6\n0000000000 65535 f \n0000000010 00000 n \n0000000060 00000 n \n0000000157 00000 n \n0000000288 00000 n \n0000000375 00000 n \ntrailer\n<<\n/Size 6\n/Root 1 0 R\n>>\nstartxref\n469\n%%EOF"
+# A tiny 1x1 PNG for image ids (may fail image processing, but the download succeeds)
+_DEMO_PNG = b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x01\x00\x00\x00\x01\x08\x06\x00\x00\x00\x1f\x15\xc4\x89\x00\x00\x00\nIDATx\x9cc\x00\x01\x00\x00\x05\x00\x01\r\n-\xb4\x00\x00\x00\x00IEND\xaeB`\x82'
+
+# Mock database of files: id -> (name, size, mime type)
+_MOCK_FILES = {
+    "doc_1": ("Project_Proposal.docx", 1024 * 25, "application/vnd.openxmlformats-officedocument.wordprocessingml.document"),
+    "doc_2": ("Financial_Report_Q1.pdf", 1024 * 500, "application/pdf"),
+    "img_1": ("Architecture_Diagram.png", 1024 * 1500, "image/png"),
+    "img_2": ("Team_Photo.jpg", 1024 * 2200, "image/jpeg"),
+    "demo_txt": ("Welcome_to_Demo.txt", 120, "text/plain"),
+    "demo_pdf": ("Multimodal_RAG_Guide.pdf", 1024 * 1024 * 2, "application/pdf")
+}
 
 
 class MockCloudProvider(BaseCloudProvider):
     """Mock provider for demonstration purposes"""
     
+    def __init__(self, credentials: CloudCredentials):
+        super().__init__(credentials)
+        self._all_files: Optional[List[CloudFile]] = None  # Static demo data, assembled on first search
+    
     async def initialize(self) -> bool:
         return True
     
@@ -947,28 +1510,16 @@ class MockCloudProvider(BaseCloudProvider):
     async def download_file(self, file_id: str) -> bytes:
         """Return dummy content"""
         if "pdf" in file_id:
-            # Return a minimal valid PDF header/content just in case (though it won't be a real readable PDF)
-            return b"%PDF-1.4\n1 0 obj\n<<\n/Type /Catalog\n/Pages 2 0 R\n>>\nendobj\n2 0 obj\n<<\n/Type /Pages\n/Kids [3 0 R]\n/Count 1\n>>\nendobj\n3 0 obj\n<<\n/Type /Page\n/MediaBox [0 0 595 842]\n/Resources <<\n/Font <<\n/F1 4 0 R\n>>\n>>\n/Contents 5 0 R\n>>\nendobj\n4 0 obj\n<<\n/Type /Font\n/Subtype /Type1\n/Name /F1\n/BaseFont /Helvetica\n>>\nendobj\n5 0 obj\n<<\n/Length 44\n>>\nstream\nBT\n/F1 24 Tf\n100 700 Td\n(This is a demo PDF file from Cloud Storage) Tj\nET\nendstream\nendobj\nxref\n0 6\n0000000000 65535 f \n0000000010 00000 n \n0000000060 00000 n \n0000000157 00000 n \n0000000288 00000 n \n0000000375 00000 n \ntrailer\n<<\n/Size 6\n/Root 1 0 R\n>>\nstartxref\n469\n%%EOF"
+            return _DEMO_PDF
         elif "png" in file_id or "jpg" in file_id:
-            # Create a simple 1x1 pixel image or just dummy bytes that might fail image processing but succeed download
-            # Ideally we'd return a valid tiny image bytes
-            return b'\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x01\x00\x00\x00\x01\x08\x06\x00\x00\x00\x1f\x15\xc4\x89\x00\x00\x00\nIDATx\x9cc\x00\x01\x00\x00\x05\x00\x01\r\n-\xb4\x00\x00\x00\x00IEND\xaeB`\x82'
+            return _DEMO_PNG
         
         return f"This is simulate content for file {file_id}.\nCloud Storage Integration Demo.".encode('utf-8')
 
     async def get_file_info(self, file_id: str) -> CloudFile:
-        # Mock database of files
-        mock_files = {
-            "doc_1": ("Project_Proposal.docx", 1024 * 25, "application/vnd.openxmlformats-officedocument.wordprocessingml.document"),
-            "doc_2": ("Financial_Report_Q1.pdf", 1024 * 500, "application/pdf"),
-            "img_1": ("Architecture_Diagram.png", 1024 * 1500, "image/png"),
-            "img_2": ("Team_Photo.jpg", 1024 * 2200, "image/jpeg"),
-            "demo_txt": ("Welcome_to_Demo.txt", 120, "text/plain"),
-            "demo_pdf": ("Multimodal_RAG_Guide.pdf", 1024 * 1024 * 2, "application/pdf")
-        }
-        
-        if file_id in mock_files:
-            name, size, mime = mock_files[file_id]
+        mock_file = _MOCK_FILES.get(file_id)
+        if mock_file:
+            name, size, mime = mock_file
             return CloudFile(
                 id=file_id, name=name, path=f"/{name}", 
                 size=size, mime_type=mime, 
@@ -984,11 +1535,16 @@ class MockCloudProvider(BaseCloudProvider):
     async def search_files(self, query: str,
                            file_types: Optional[List[str]] = None) -> List[CloudFile]:
         """Search mock files"""
-        all_files = await self.list_files() + \
-                   await self.list_files("folder_docs") + \
-                   await self.list_files("folder_imgs")
+        if self._all_files is None:
+            root, docs, imgs = await asyncio.gather(
+                self.list_files(),
+                self.list_files("folder_docs"),
+                self.list_files("folder_imgs")
+            )
+            self._all_files = root + docs + imgs
         
-        return [f for f in all_files if query.lower() in f.name.lower()]
+        query = query.lower()
+        return [f for f in self._all_files if query in f.name.lower()]
 
 
 class CloudStorageManager:
@@ -997,14 +1553,25 @@ class CloudStorageManager:
     Handles provider initialization, caching, and operations.
     """
     
+    LISTING_CACHE_TTL = 30  # seconds
+    LISTING_CACHE_MAX_SIZE = 256
+    
     def __init__(self):
         self._providers: Dict[CloudProvider, BaseCloudProvider] = {}
+        self._listing_cache: Dict[tuple, tuple] = {}  # (provider, folder_id) -> (files, cached_at)
+        self._download_cache = DownloadCache(
+            settings.cloud_download_cache_dir,
+            settings.cloud_download_cache_max_mb * 1024 * 1024
+        )
+        self._import_semaphore: Optional[asyncio.Semaphore] = None  # Created on first use, inside the loop
+        self._connector = None  # HTTP connection pool shared by all providers, created inside the loop
         self._credentials_file = Path("./data/cloud_credentials.json")
-        self._supported_file_types = [
+        self._credentials_lock = threading.Lock()  # Credential writes run in worker threads
+        self._supported_file_types = (
             'pdf', 'docx', 'doc', 'txt', 
             'jpg', 'jpeg', 'png', 'bmp', 'tiff',
             'mp3', 'wav', 'm4a', 'mp4'
-        ]
+        )
     
     async def connect_provider(self, credentials: CloudCredentials) -> Dict[str, Any]:
         """Connect to a cloud storage provider"""
@@ -1029,14 +1596,21 @@ class CloudStorageManager:
                         "success": False,
                         "error": f"Unknown provider: {credentials.provider.value}"
                     }
-                provider_instance = provider_class(credentials)
+                provider_instance = provider_class(credentials, connector=self._get_connector())
+            
+            # Keep the saved credentials current when the provider refreshes its token
+            provider_instance.on_credentials_refreshed = self._persist_credentials
             
             # Initialize connection
             if await provider_instance.initialize():
+                previous = self._providers.get(credentials.provider)
                 self._providers[credentials.provider] = provider_instance
+                self._invalidate_listings(credentials.provider)
+                if previous is not None:
+                    await previous.close()
                 
                 # Save credentials (even demo ones to persist session)
-                self._save_credentials(credentials)
+                await asyncio.to_thread(self._save_credentials, credentials)
                 
                 return {
                     "success": True,
@@ -1056,8 +1630,9 @@ class CloudStorageManager:
     async def disconnect_provider(self, provider: CloudProvider) -> Dict[str, Any]:
         """Disconnect from a cloud storage provider"""
         if provider in self._providers:
-            del self._providers[provider]
-            self._remove_credentials(provider)
+            await self._providers.pop(provider).close()
+            self._invalidate_listings(provider)
+            await asyncio.to_thread(self._remove_credentials, provider)
             
             return {
                 "success": True,
@@ -1069,6 +1644,22 @@ class CloudStorageManager:
                 "error": f"Provider {provider.value} is not connected"
             }
     
+    def _get_connector(self):
+        """Get the shared HTTP connection pool, creating it on first use (None without aiohttp)"""
+        if aiohttp is None:
+            return None
+        if self._connector is None or self._connector.closed:
+            self._connector = BaseCloudProvider.create_connector()
+        return self._connector
+    
+    async def close(self):
+        """Close every connected provider's HTTP session and the shared pool (keeps saved credentials)"""
+        for provider in list(self._providers.values()):
+            await provider.close()
+        if self._connector is not None:
+            await self._connector.close()
+            self._connector = None
+    
     def get_connected_providers(self) -> List[str]:
         """Get list of connected provider names"""
         return [p.value for p in self._providers.keys()]
@@ -1079,10 +1670,30 @@ class CloudStorageManager:
         if provider not in self._providers:
             return []
         
-        return await self._providers[provider].list_files(
+        # Serve repeated listings of the same folder from memory for a short TTL
+        cache_key = (provider, folder_id)
+        cached = self._listing_cache.get(cache_key)
+        if cached is not None:
+            files, cached_time = cached
+            if (datetime.now() - cached_time).total_seconds() < self.LISTING_CACHE_TTL:
+                return list(files)
+            del self._listing_cache[cache_key]
+        
+        files = await self._providers[provider].list_files(
             folder_id=folder_id,
             file_types=self._supported_file_types
         )
+        
+        if files:
+            if len(self._listing_cache) >= self.LISTING_CACHE_MAX_SIZE:
+                self._listing_cache.pop(next(iter(self._listing_cache)))
+            self._listing_cache[cache_key] = (files, datetime.now())
+        return list(files)
+    
+    def _invalidate_listings(self, provider: CloudProvider):
+        """Drop cached folder listings for a provider"""
+        for key in [k for k in self._listing_cache if k[0] == provider]:
+            del self._listing_cache[key]
     
     async def download_file(self, provider: CloudProvider, file_id: str) -> bytes:
         """Download a file from a provider"""
@@ -1091,21 +1702,32 @@ class CloudStorageManager:
         
         return await self._providers[provider].download_file(file_id)
     
+    async def _stream_to_path(self, provider: CloudProvider, file_id: str, save_path: Path) -> int:
+        """Stream a download straight to disk; returns bytes written (0 and no file on failure)"""
+        written = 0
+        try:
+            save_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(save_path, "wb") as f:
+                async for chunk in self._providers[provider].stream_file(file_id):
+                    await asyncio.to_thread(f.write, chunk)
+                    written += len(chunk)
+        except Exception as e:
+            logger.error(f"Failed to download {file_id} to {save_path}: {e}")
+            written = 0
+        
+        if not written:
+            save_path.unlink(missing_ok=True)
+        return written
+    
     async def download_and_save(self, provider: CloudProvider, file_id: str, 
                                  save_path: Path) -> Optional[Path]:
         """Download a file and save it locally"""
-        file_data = await self.download_file(provider, file_id)
-        
-        if not file_data:
+        if provider not in self._providers:
             return None
         
-        try:
-            save_path.parent.mkdir(parents=True, exist_ok=True)
-            save_path.write_bytes(file_data)
-            return save_path
-        except Exception as e:
-            logger.error(f"Failed to save downloaded file: {e}")
+        if not await self._stream_to_path(provider, file_id, save_path):
             return None
+        return save_path
     
     async def search_files(self, provider: CloudProvider, 
                            query: str) -> List[CloudFile]:
@@ -1119,12 +1741,18 @@ class CloudStorageManager:
         )
     
     async def search_all_providers(self, query: str) -> Dict[str, List[CloudFile]]:
-        """Search files across all connected providers"""
-        results = {}
+        """Search files across all connected providers concurrently"""
+        providers = list(self._providers)
+        outcomes = await asyncio.gather(
+            *(self.search_files(provider, query) for provider in providers),
+            return_exceptions=True
+        )
         
-        for provider in self._providers:
-            files = await self.search_files(provider, query)
-            if files:
+        results = {}
+        for provider, files in zip(providers, outcomes):
+            if isinstance(files, BaseException):
+                logger.error(f"{provider.value} search error: {files}")
+            elif files:
                 results[provider.value] = files
         
         return results
@@ -1140,42 +1768,77 @@ class CloudStorageManager:
             file_info = await self._providers[provider].get_file_info(file_id)
             filename = file_info.name if file_info else f"imported_{file_id}_{int(time.time())}.bin"
         except Exception:
+            file_info = None
             filename = f"imported_{file_id}_{int(time.time())}.bin"
         
-        # Download file
-        file_data = await self.download_file(provider, file_id)
-        if not file_data:
-            return None
+        # Provider version tag (ETag/cTag/content hash); unchanged files are served from the cache
+        version = (file_info.metadata or {}).get('etag') if file_info else None
         
-        # Save locally
-        local_path = upload_dir / filename
+        # Save locally, claiming the name up front so concurrent imports can't pick the same file
+        local_path = self._reserve_path(upload_dir, filename)
         
-        # Avoid overwriting - add number suffix if needed
-        counter = 1
-        while local_path.exists():
-            stem = Path(filename).stem
-            suffix = Path(filename).suffix
-            local_path = upload_dir / f"{stem}_{counter}{suffix}"
-            counter += 1
+        file_size = 0
+        if version:
+            file_size = await asyncio.to_thread(
+                self._download_cache.restore, provider.value, file_id, version, local_path
+            )
         
-        local_path.write_bytes(file_data)
+        if not file_size:
+            # Download file, streaming it to disk rather than buffering it in memory
+            file_size = await self._stream_to_path(provider, file_id, local_path)
+            if not file_size:
+                return None
+            if version:
+                await asyncio.to_thread(
+                    self._download_cache.store, provider.value, file_id, version, local_path, file_size
+                )
         
         return {
             "success": True,
             "local_path": str(local_path),
             "file_name": local_path.name,
-            "file_size": len(file_data),
+            "file_size": file_size,
             "source_provider": provider.value,
             "source_file_id": file_id
         }
     
+    @staticmethod
+    def _reserve_path(upload_dir: Path, filename: str) -> Path:
+        """Atomically create an empty file for the import, adding a number suffix if the name is taken"""
+        upload_dir.mkdir(parents=True, exist_ok=True)
+        local_path = upload_dir / filename
+        stem = Path(filename).stem
+        suffix = Path(filename).suffix
+        counter = 1
+        while True:
+            try:
+                local_path.open('x').close()
+                return local_path
+            except FileExistsError:
+                # Scan the directory once instead of probing name_1, name_2, ... one by one
+                taken = {entry.name for entry in os.scandir(upload_dir)}
+                while f"{stem}_{counter}{suffix}" in taken:
+                    counter += 1
+                local_path = upload_dir / f"{stem}_{counter}{suffix}"
+                counter += 1
+    
     async def batch_import(self, provider: CloudProvider, file_ids: List[str],
                            upload_dir: Path) -> List[Dict[str, Any]]:
-        """Import multiple files from cloud storage"""
-        results = []
+        """Import multiple files from cloud storage concurrently (results in file_ids order)"""
+        if self._import_semaphore is None:
+            self._import_semaphore = asyncio.Semaphore(settings.cloud_import_concurrency)
+        
+        async def _import(file_id: str) -> Optional[Dict[str, Any]]:
+            async with self._import_semaphore:
+                return await self.import_file(provider, file_id, upload_dir)
+        
+        outcomes = await asyncio.gather(*map(_import, file_ids), return_exceptions=True)
         
-        for file_id in file_ids:
-            result = await self.import_file(provider, file_id, upload_dir)
+        results = []
+        for file_id, result in zip(file_ids, outcomes):
+            if isinstance(result, BaseException):
+                logger.error(f"Import of {file_id} failed: {result}")
+                result = None
             if result:
                 results.append(result)
             else:
@@ -1197,31 +1860,40 @@ class CloudStorageManager:
         }
         return provider_map.get(provider)
     
+    async def _persist_credentials(self, credentials: CloudCredentials):
+        """Save refreshed credentials without blocking the event loop"""
+        await asyncio.to_thread(self._save_credentials, credentials)
+    
     def _save_credentials(self, credentials: CloudCredentials):
         """Save credentials to file (should be encrypted in production)"""
         try:
-            self._credentials_file.parent.mkdir(parents=True, exist_ok=True)
-            
-            # Load existing credentials
-            existing = {}
-            if self._credentials_file.exists():
-                existing = json.loads(self._credentials_file.read_text())
-            
-            # Add/update this provider's credentials
-            cred_data = {
-                "access_token": credentials.access_token,
-                "refresh_token": credentials.refresh_token,
-                "api_key": credentials.api_key,
-                "api_secret": credentials.api_secret,
-                "aws_access_key_id": credentials.aws_access_key_id,
-                "aws_secret_access_key": credentials.aws_secret_access_key,
-                "aws_region": credentials.aws_region,
-                "s3_bucket": credentials.s3_bucket
-            }
-            
-            existing[credentials.provider.value] = cred_data
-            
-            self._credentials_file.write_text(json.dumps(existing, indent=2))
+            with self._credentials_lock:
+                self._credentials_file.parent.mkdir(parents=True, exist_ok=True)
+                
+                # Load existing credentials
+                existing = {}
+                if self._credentials_file.exists():
+                    existing = orjson.loads(self._credentials_file.read_bytes())
+                
+                # Add/update this provider's credentials
+                cred_data = {
+                    "access_token": credentials.access_token,
+                    "refresh_token": credentials.refresh_token,
+                    "api_key": credentials.api_key,
+                    "api_secret": credentials.api_secret,
+                    "aws_access_key_id": credentials.aws_access_key_id,
+                    "aws_secret_access_key": credentials.aws_secret_access_key,
+                    "aws_region": credentials.aws_region,
+                    "s3_bucket": credentials.s3_bucket,
+                    "expires_at": credentials.expires_at.isoformat() if credentials.expires_at else None
+                }
+                
+                # Reconnecting with the stored credentials (e.g. at startup) needs no rewrite
+                if existing.get(credentials.provider.value) == cred_data:
+                    return
+                existing[credentials.provider.value] = cred_data
+                
+                self._credentials_file.write_bytes(orjson.dumps(existing, option=orjson.OPT_INDENT_2))
             
         except Exception as e:
             logger.error(f"Failed to save credentials: {e}")
@@ -1229,14 +1901,15 @@ class CloudStorageManager:
     def _remove_credentials(self, provider: CloudProvider):
         """Remove credentials for a provider"""
         try:
-            if not self._credentials_file.exists():
-                return
-            
-            existing = json.loads(self._credentials_file.read_text())
-            
-            if provider.value in existing:
-                del existing[provider.value]
-                self._credentials_file.write_text(json.dumps(existing, indent=2))
+            with self._credentials_lock:
+                if not self._credentials_file.exists():
+                    return
+                
+                existing = orjson.loads(self._credentials_file.read_bytes())
+                
+                if provider.value in existing:
+                    del existing[provider.value]
+                    self._credentials_file.write_bytes(orjson.dumps(existing, option=orjson.OPT_INDENT_2))
                 
         except Exception as e:
             logger.error(f"Failed to remove credentials: {e}")
@@ -1249,8 +1922,9 @@ class CloudStorageManager:
             if not self._credentials_file.exists():
                 return results
             
-            saved = json.loads(self._credentials_file.read_text())
+            saved = orjson.loads(self._credentials_file.read_bytes())
             
+            pending = []
             for provider_name, cred_data in saved.items():
                 try:
                     provider = CloudProvider(provider_name)
@@ -1263,16 +1937,27 @@ class CloudStorageManager:
                         aws_access_key_id=cred_data.get('aws_access_key_id'),
                         aws_secret_access_key=cred_data.get('aws_secret_access_key'),
                         aws_region=cred_data.get('aws_region'),
-                        s3_bucket=cred_data.get('s3_bucket')
+                        s3_bucket=cred_data.get('s3_bucket'),
+                        expires_at=datetime.fromisoformat(cred_data['expires_at']) if cred_data.get('expires_at') else None
                     )
-                    
-                    result = await self.connect_provider(credentials)
-                    results[provider_name] = result.get('success', False)
+                    pending.append((provider_name, credentials))
                     
                 except Exception as e:
                     logger.error(f"Failed to reconnect {provider_name}: {e}")
                     results[provider_name] = False
             
+            # Providers initialize against different hosts - reconnect them all at once
+            outcomes = await asyncio.gather(
+                *(self.connect_provider(credentials) for _, credentials in pending),
+                return_exceptions=True
+            )
+            for (provider_name, _), result in zip(pending, outcomes):
+                if isinstance(result, BaseException):
+                    logger.error(f"Failed to reconnect {provider_name}: {result}")
+                    results[provider_name] = False
+                else:
+                    results[provider_name] = result.get('success', False)
+            
         except Exception as e:
             logger.error(f"Failed to load saved connections: {e}")
         
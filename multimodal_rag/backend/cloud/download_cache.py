@@ -0,0 +1,172 @@
+"""Persistent cache of downloaded cloud files, keyed by the provider's version tag."""
+import hashlib
+import os
+import shutil
+import sqlite3
+import threading
+import time
+import uuid
+from pathlib import Path
+
+from backend.utils.logger import logger
+
+
+def _copy_file(src: Path, dest: Path):
+    """Copy src to dest through a temp file, replacing any existing dest atomically.
+
+    Cached blobs and imported files never share an inode: imports land in the watched
+    upload folder, where users edit files in place.
+    """
+    tmp = dest.with_name(f".{dest.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        shutil.copyfile(src, tmp)
+        os.replace(tmp, dest)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+class DownloadCache:
+    """SQLite index over cached cloud downloads stored as files on disk.
+
+    A cached file is only served while the provider still reports the same version
+    tag (ETag, cTag or content hash) for it. Blobs are evicted least recently used
+    first once their total size exceeds max_bytes. Methods block; call them via
+    asyncio.to_thread.
+    """
+
+    def __init__(self, cache_dir: Path, max_bytes: int):
+        self.hits = 0
+        self.misses = 0
+        self.max_bytes = max_bytes
+        self._blob_dir = cache_dir / "blobs"
+        self._lock = threading.Lock()
+        self._conn = None
+
+        try:
+            self._blob_dir.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(
+                str(cache_dir / "downloads.sqlite3"),
+                check_same_thread=False
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS downloads ("
+                "provider TEXT NOT NULL, file_id TEXT NOT NULL, version TEXT NOT NULL, "
+                "blob TEXT NOT NULL, size INTEGER NOT NULL, last_used REAL NOT NULL DEFAULT 0, "
+                "PRIMARY KEY (provider, file_id))"
+            )
+            try:
+                # Caches created before eviction existed lack the LRU column
+                self._conn.execute("ALTER TABLE downloads ADD COLUMN last_used REAL NOT NULL DEFAULT 0")
+            except sqlite3.OperationalError:
+                pass
+            self._conn.commit()
+            logger.info(f"Cloud download cache ready: {cache_dir}")
+        except Exception as e:
+            logger.error(f"Failed to open cloud download cache: {e}")
+            self._conn = None
+
+    @staticmethod
+    def _blob_name(provider: str, file_id: str, version: str) -> str:
+        return hashlib.sha256(f"{provider}\0{file_id}\0{version}".encode("utf-8")).hexdigest()
+
+    def restore(self, provider: str, file_id: str, version: str, dest: Path) -> int:
+        """Copy the cached version of a file to dest; returns its size (0 on a miss)."""
+        if self._conn is None:
+            return 0
+
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT blob, size FROM downloads WHERE provider = ? AND file_id = ? AND version = ?",
+                    (provider, file_id, version)
+                ).fetchone()
+            if row is not None:
+                dest.parent.mkdir(parents=True, exist_ok=True)
+                try:
+                    _copy_file(self._blob_dir / row[0], dest)
+                except FileNotFoundError:
+                    # Blob removed from disk; forget it and re-download
+                    with self._lock:
+                        self._conn.execute(
+                            "DELETE FROM downloads WHERE provider = ? AND file_id = ?",
+                            (provider, file_id)
+                        )
+                        self._conn.commit()
+                else:
+                    with self._lock:
+                        self._conn.execute(
+                            "UPDATE downloads SET last_used = ? WHERE provider = ? AND file_id = ?",
+                            (time.time(), provider, file_id)
+                        )
+                        self._conn.commit()
+                    self.hits += 1
+                    return row[1]
+        except Exception as e:
+            logger.error(f"Cloud download cache lookup failed: {e}")
+
+        self.misses += 1
+        return 0
+
+    def store(self, provider: str, file_id: str, version: str, src: Path, size: int):
+        """Keep a copy of a finished download, replacing any older cached version of the same file."""
+        if self._conn is None or size > self.max_bytes:
+            return
+
+        name = self._blob_name(provider, file_id, version)
+        try:
+            blob = self._blob_dir / name
+            if not blob.exists():
+                _copy_file(src, blob)
+            with self._lock:
+                previous = self._conn.execute(
+                    "SELECT blob FROM downloads WHERE provider = ? AND file_id = ?",
+                    (provider, file_id)
+                ).fetchone()
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO downloads (provider, file_id, version, blob, size, last_used) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (provider, file_id, version, name, size, time.time())
+                )
+                evicted = self._evict()
+                self._conn.commit()
+            if previous is not None and previous[0] != name:
+                evicted.append(previous[0])
+            for stale in evicted:
+                (self._blob_dir / stale).unlink(missing_ok=True)
+        except Exception as e:
+            logger.error(f"Cloud download cache write failed: {e}")
+
+    def _evict(self) -> list:
+        """Drop least recently used entries until the cache fits max_bytes (call under the lock).
+
+        Returns the evicted blob names; the caller deletes them after committing.
+        """
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM downloads").fetchone()[0]
+        evicted = []
+        if total <= self.max_bytes:
+            return evicted
+
+        rows = self._conn.execute(
+            "SELECT provider, file_id, blob, size FROM downloads ORDER BY last_used"
+        ).fetchall()
+        for provider, file_id, blob, size in rows:
+            if total <= self.max_bytes:
+                break
+            self._conn.execute(
+                "DELETE FROM downloads WHERE provider = ? AND file_id = ?",
+                (provider, file_id)
+            )
+            evicted.append(blob)
+            total -= size
+        return evicted
+
+    def get_stats(self) -> dict:
+        """Get cache hit/miss counters."""
+        total = self.hits + self.misses
+        return {
+            "enabled": self._conn is not None,
+            "cache_hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 3) if total else 0.0
+        }
@@ -1,6 +1,6 @@
 """Simplified configuration without pydantic-settings dependency."""
 from pathlib import Path
-from typing import List
+from typing import FrozenSet
 import os
 
 
@@ -25,6 +25,8 @@ class Settings:
     # Embedding Models
     text_embedding_model: str = os.getenv("TEXT_EMBEDDING_MODEL", "sentence-transformers/all-MiniLM-L6-v2")
     image_embedding_model: str = os.getenv("IMAGE_EMBEDDING_MODEL", "openai/clip-vit-base-patch32")
+    embedding_batch_size: int = int(os.getenv("EMBEDDING_BATCH_SIZE", "64"))
+    embedding_fp16: bool = os.getenv("EMBEDDING_FP16", "true").lower() == "true"  # Half precision when the model runs on CUDA
     whisper_model: str = os.getenv("WHISPER_MODEL", "tiny")
     
     # Retrieval Configuration
@@ -36,24 +38,35 @@ class Settings:
     host: str = os.getenv("HOST", "0.0.0.0")
     port: int = int(os.getenv("PORT", "8000"))
     debug: bool = os.getenv("DEBUG", "true").lower() == "true"
+    worker_threads: int = int(os.getenv("WORKER_THREADS", "32"))  # Threads for offloaded blocking work
+    watch_on_startup: bool = os.getenv("WATCH_ON_STARTUP", "false").lower() == "true"
+    cloud_import_concurrency: int = int(os.getenv("CLOUD_IMPORT_CONCURRENCY", "16"))  # Parallel downloads per batch import
+    cpu_pool_workers: int = int(os.getenv("CPU_POOL_WORKERS", "0"))  # Document/image/audio worker processes; 0 = threads (e.g. GPU models)
     
     # Upload Limits
     max_file_size_mb: int = int(os.getenv("MAX_FILE_SIZE_MB", "50"))
-    allowed_extensions: List[str] = os.getenv(
-        "ALLOWED_EXTENSIONS", 
-        "pdf,docx,txt,jpg,jpeg,png,bmp,tiff,mp3,wav,m4a,mp4,m4v,mpeg,mpg,avi,flac,ogg,aac"
-    ).split(",")
+    allowed_extensions: FrozenSet[str] = frozenset(
+        ext.strip().lower().lstrip('.') for ext in os.getenv(
+            "ALLOWED_EXTENSIONS", 
+            "pdf,docx,txt,jpg,jpeg,png,bmp,tiff,mp3,wav,m4a,mp4,m4v,mpeg,mpg,avi,flac,ogg,aac"
+        ).split(",") if ext.strip()
+    )
     
     # Paths
     upload_dir: Path = Path(os.getenv("UPLOAD_DIR", "./data/uploads"))
     cloud_import_dir: Path = Path(os.getenv("CLOUD_IMPORT_DIR", "./data/cloud_imports"))
     processed_dir: Path = Path(os.getenv("PROCESSED_DIR", "./data/processed"))
+    embedding_cache_dir: Path = Path(os.getenv("EMBEDDING_CACHE_DIR", "./data/emb_cache"))
+    cloud_download_cache_dir: Path = Path(os.getenv("CLOUD_DOWNLOAD_CACHE_DIR", "./data/cloud_imports/.download_cache"))
+    cloud_download_cache_max_mb: int = int(os.getenv("CLOUD_DOWNLOAD_CACHE_MAX_MB", "2048"))  # Least recently used downloads are evicted beyond this
     
     def __init__(self):
         # Create directories if they don't exist
         self.upload_dir.mkdir(parents=True, exist_ok=True)
         self.cloud_import_dir.mkdir(parents=True, exist_ok=True)
         self.processed_dir.mkdir(parents=True, exist_ok=True)
+        self.embedding_cache_dir.mkdir(parents=True, exist_ok=True)
+        self.cloud_download_cache_dir.mkdir(parents=True, exist_ok=True)
         Path(self.chroma_persist_dir).mkdir(parents=True, exist_ok=True)
 
 
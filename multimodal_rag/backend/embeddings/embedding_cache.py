@@ -0,0 +1,98 @@
+"""Persistent content-hash cache for chunk embeddings."""
+import hashlib
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, List, Union
+
+import numpy as np
+
+from backend.utils.logger import logger
+
+
+class EmbeddingCache:
+    """SQLite-backed cache mapping chunk content hashes to embedding vectors."""
+
+    # Stay below SQLite's bound-parameter limit on older builds
+    _LOOKUP_BATCH_SIZE = 500
+
+    def __init__(self, cache_dir: Path, model_name: str):
+        self.model_name = model_name
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = None
+
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(
+                str(cache_dir / "embeddings.sqlite3"),
+                check_same_thread=False
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings (key BLOB PRIMARY KEY, vector BLOB NOT NULL)"
+            )
+            self._conn.commit()
+            logger.logger.info(f"Embedding cache ready: {cache_dir}")
+        except Exception as e:
+            logger.logger.error(f"Failed to open embedding cache: {e}")
+            self._conn = None
+
+    def make_key(self, content: str) -> bytes:
+        """Build the cache key (raw SHA-256 digest) for a chunk's content under the current model."""
+        # Hash the whole encoded chunk in one call so OpenSSL can use SHA-NI
+        return hashlib.sha256(f"{self.model_name}\0{content}".encode("utf-8")).digest()
+
+    def get_many(self, keys: List[bytes]) -> Dict[bytes, np.ndarray]:
+        """Look up cached embeddings (float32 rows), returning only the keys that were found."""
+        found: Dict[bytes, np.ndarray] = {}
+
+        if self._conn is not None and keys:
+            unique_keys = list(dict.fromkeys(keys))
+            try:
+                with self._lock:
+                    for start in range(0, len(unique_keys), self._LOOKUP_BATCH_SIZE):
+                        batch = unique_keys[start:start + self._LOOKUP_BATCH_SIZE]
+                        placeholders = ",".join("?" * len(batch))
+                        rows = self._conn.execute(
+                            f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})",
+                            batch
+                        ).fetchall()
+                        for key, blob in rows:
+                            found[key] = np.frombuffer(blob, dtype=np.float32)
+            except Exception as e:
+                logger.logger.error(f"Embedding cache lookup failed: {e}")
+
+        hit_count = sum(1 for key in keys if key in found)
+        self.hits += hit_count
+        self.misses += len(keys) - hit_count
+        return found
+
+    def set_many(self, items: Dict[bytes, Union[np.ndarray, List[float]]]):
+        """Store embeddings for the given keys."""
+        if self._conn is None or not items:
+            return
+
+        rows = [
+            (key, np.asarray(vector, dtype=np.float32).tobytes())
+            for key, vector in items.items()
+        ]
+        try:
+            with self._lock:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)",
+                    rows
+                )
+                self._conn.commit()
+        except Exception as e:
+            logger.logger.error(f"Embedding cache write failed: {e}")
+
+    def get_stats(self) -> dict:
+        """Get cache hit/miss counters."""
+        total = self.hits + self.misses
+        return {
+            "enabled": self._conn is not None,
+            "cache_hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 3) if total else 0.0
+        }
@@ -1,11 +1,9 @@
 """Manager for generating embeddings for different modalities."""
 from typing import List, Union, Any
-try:
-    from sentence_transformers import SentenceTransformer
-except ImportError:
-    SentenceTransformer = None
 
 from backend.config import settings
+from backend.embeddings.embedding_cache import EmbeddingCache
+from backend.embeddings.text_embedder import get_text_model
 from backend.models.document import DocumentChunk, Modality
 from backend.utils.logger import logger
 
@@ -13,17 +11,20 @@ class EmbeddingManager:
     """Manages embedding models and generation."""
     
     def __init__(self):
-        self.text_model = None
         self.image_model = None
-        
-        try:
-            if SentenceTransformer:
-                logger.logger.info(f"Loading text embedding model: {settings.text_embedding_model}")
-                self.text_model = SentenceTransformer(settings.text_embedding_model)
-            else:
-                logger.logger.warning("sentence-transformers not installed, using dummy embeddings")
-        except Exception as e:
-            logger.logger.error(f"Failed to load embedding models: {e}")
+        self.cache = EmbeddingCache(settings.embedding_cache_dir, settings.text_embedding_model)
+        self.text_model = get_text_model()
+        if self.text_model is None:
+            logger.logger.warning("No text embedding model available, using dummy embeddings")
+
+    def warmup(self):
+        """Run one tiny encode so model weights are loaded before the first request."""
+        if self.text_model:
+            try:
+                self.text_model.encode(["warmup"])
+                logger.logger.info("Text embedding model warmed up")
+            except Exception as e:
+                logger.logger.warning(f"Embedding warmup failed: {e}")
 
     def embed_query(self, query: str, modality: Modality = Modality.TEXT) -> List[float]:
         """Generate embedding for a query."""
@@ -40,20 +41,39 @@ class EmbeddingManager:
         logger.logger.warning(f"Using dummy embedding for modality={modality}")
         return [0.0] * 384
 
-    def embed_chunks(self, chunks: List[DocumentChunk]) -> List[DocumentChunk]:
-        """Generate embeddings for a list of chunks."""
+    def embed_chunks(self, chunks: List[DocumentChunk], batch_size: int = settings.embedding_batch_size) -> List[DocumentChunk]:
+        """Generate embeddings for a list of chunks, encoding `batch_size` texts per forward pass."""
         if not chunks:
             return []
             
         # Handle TEXT and AUDIO chunks (audio is transcribed to text)
         text_based_chunks = [c for c in chunks if c.modality in [Modality.TEXT, Modality.AUDIO]]
         if text_based_chunks and self.text_model:
-            texts = [c.content for c in text_based_chunks]
-            embeddings = self.text_model.encode(texts).tolist()
+            # Reuse embeddings for content we've already seen
+            keys = [self.cache.make_key(c.content) for c in text_based_chunks]
+            cached = self.cache.get_many(keys)
+            
+            misses = []
+            for chunk, key in zip(text_based_chunks, keys):
+                if key in cached:
+                    chunk.embedding = cached[key]
+                else:
+                    misses.append((chunk, key))
             
-            # Assign embeddings
-            for i, chunk in enumerate(text_based_chunks):
-                chunk.embedding = embeddings[i]
+            if misses:
+                texts = [chunk.content for chunk, _ in misses]
+                embeddings = self.text_model.encode(
+                    texts,
+                    batch_size=batch_size,
+                    convert_to_numpy=True,
+                    show_progress_bar=False
+                )
+                
+                # Assign row views of the encoded matrix; VectorStore converts them for Chroma
+                for (chunk, _), embedding in zip(misses, embeddings):
+                    chunk.embedding = embedding
+                
+                self.cache.set_many({key: embedding for (_, key), embedding in zip(misses, embeddings)})
         
         # For IMAGE modality, we'd need CLIP or similar
         # For now, skip image embeddings (can be added later)
@@ -1,4 +1,5 @@
 """Text embedding functionality."""
+import threading
 from typing import List, Union
 import numpy as np
 
@@ -10,26 +11,60 @@ except ImportError:
 from backend.config import settings
 from backend.utils.logger import logger
 
+# One SentenceTransformer per process, shared by EmbeddingManager and TextEmbedder
+_text_model = None
+_text_model_loaded = False
+_text_model_lock = threading.Lock()
+
+
+def get_text_model():
+    """Load the configured text embedding model once and return it (None if unavailable)."""
+    global _text_model, _text_model_loaded
+    with _text_model_lock:
+        if not _text_model_loaded:
+            _text_model_loaded = True
+            try:
+                if SentenceTransformer:
+                    logger.logger.info(f"Loading text embedding model: {settings.text_embedding_model}")
+                    _text_model = SentenceTransformer(settings.text_embedding_model)
+                    if settings.embedding_fp16 and _text_model.device.type == "cuda":
+                        _text_model.half()
+                else:
+                    logger.logger.warning("sentence-transformers not installed")
+            except Exception as e:
+                logger.logger.error(f"Failed to load text embedding model: {e}")
+        return _text_model
+
+
+def l2_normalize(vectors: np.ndarray) -> np.ndarray:
+    """Scale each row to unit length in place (zero rows are left as zeros)."""
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    np.maximum(norms, 1e-12, out=norms)
+    vectors /= norms
+    return vectors
+
+
 class TextEmbedder:
     """Generates embeddings for text."""
     
     def __init__(self):
-        self.model = None
-        try:
-            if SentenceTransformer:
-                self.model = SentenceTransformer(settings.text_embedding_model)
-            else:
-                logger.logger.warning("sentence-transformers not installed")
-        except Exception as e:
-            logger.logger.error(f"Failed to load text embedding model: {e}")
-
-    def embed(self, texts: List[str]) -> np.ndarray:
-        """Generate embeddings for a list of texts."""
+        self.model = get_text_model()
+
+    def embed(self, texts: List[str], normalize: bool = False) -> np.ndarray:
+        """Generate embeddings for a list of texts (unit-length rows when normalize is set)."""
         if not texts:
             return np.array([])
             
         if self.model:
-            return self.model.encode(texts)
+            # FP16 models return float16 rows; hand callers float32 as before
+            return self.model.encode(
+                texts,
+                batch_size=settings.embedding_batch_size,
+                convert_to_numpy=True,
+                normalize_embeddings=normalize,
+                show_progress_bar=False
+            ).astype(np.float32, copy=False)
             
         # Fallback dummy embeddings
-        return np.random.rand(len(texts), 384)
+        vectors = np.random.rand(len(texts), 384)
+        return l2_normalize(vectors) if normalize else vectors
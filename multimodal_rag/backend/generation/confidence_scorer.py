@@ -1,6 +1,5 @@
 """Confidence scorer for assessing evidence quality."""
 from typing import List
-import numpy as np
 
 from backend.models.query import EvidenceSource
 from backend.utils.logger import logger
@@ -22,22 +21,29 @@ class ConfidenceScorer:
         if not sources:
             return 0.0, "None", "No evidence found"
         
-        # Calculate component scores
-        relevance_scores = [s.relevance_score for s in sources]
-        source_confidences = [s.confidence for s in sources]
+        # Calculate component scores in one pass (plain floats; numpy only adds overhead here)
+        relevance_total = 0.0
+        confidence_total = 0.0
+        modalities = set()
+        source_files = set()
+        for s in sources:
+            relevance_total += s.relevance_score
+            confidence_total += s.confidence
+            modalities.add(s.modality)
+            source_files.add(s.source_file)
         
         # Average relevance
-        avg_relevance = np.mean(relevance_scores)
+        avg_relevance = relevance_total / len(sources)
         
         # Average source quality
-        avg_confidence = np.mean(source_confidences)
+        avg_confidence = confidence_total / len(sources)
         
         # Cross-modal agreement (bonus if multiple modalities)
-        unique_modalities = len(set(s.modality for s in sources))
+        unique_modalities = len(modalities)
         cross_modal_bonus = min(0.1 * (unique_modalities - 1), 0.2)
         
         # Diversity score (more unique sources = higher confidence)
-        unique_sources = len(set(s.source_file for s in sources))
+        unique_sources = len(source_files)
         diversity_bonus = min(0.05 * unique_sources, 0.15)
         
         # Combined confidence
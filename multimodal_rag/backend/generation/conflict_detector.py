@@ -1,24 +1,34 @@
 """Conflict detector for identifying contradictions in evidence."""
 from typing import List, Optional, Dict
 import re
-from sklearn.metrics.pairwise import cosine_similarity
+import threading
 import numpy as np
 
 from backend.models.query import EvidenceSource, ConflictInfo
 from backend.embeddings.text_embedder import TextEmbedder
 from backend.utils.logger import logger
 
+_NUMBER_RE = re.compile(r'\d+(?:\.\d+)?')
+_SENTENCE_RE = re.compile(r'[^.!?]+')  # Runs of text between sentence terminators
+
 
 class ConflictDetector:
     """Detects contradictions and conflicts between evidence sources."""
     
+    # Claims from popular chunks recur across queries; keep their vectors (LRU)
+    EMBEDDING_CACHE_SIZE = 1024
+    
     def __init__(self):
         self.embedder = TextEmbedder()
+        self._embedding_cache: Dict[str, np.ndarray] = {}  # claim -> unit vector, least recent first
+        self._cache_lock = threading.Lock()  # detect_conflicts runs in worker threads
         self.negation_patterns = [
             r'\bnot\b', r'\bno\b', r'\bnever\b', r'\bneither\b',
             r'\bcontradicts?\b', r'\bdisproves?\b', r'\brefutes?\b',
             r'\binstead\b', r'\bhowever\b', r'\bbut\b'
         ]
+        # One alternation scans a claim once instead of once per pattern
+        self._negation_re = re.compile('|'.join(self.negation_patterns), re.IGNORECASE)
     
     def detect_conflicts(self, sources: List[EvidenceSource]) -> Optional[ConflictInfo]:
         """
@@ -42,24 +52,54 @@ class ConflictDetector:
         if len(claims_by_source) < 2:
             return None
         
-        # Pairwise comparison
-        conflicts = []
+        # Cheap textual pre-scan: two sources can only conflict if some pair of their claims
+        # differs in negation or carries different numbers; other pairs never need embedding
+        for entry in claims_by_source.values():
+            entry['features'] = [self._claim_features(claim) for claim in entry['claims']]
+        
         source_ids = list(claims_by_source.keys())
+        candidate_pairs = [
+            (source_ids[i], source_ids[j])
+            for i in range(len(source_ids))
+            for j in range(i + 1, len(source_ids))
+            if self._may_conflict(
+                claims_by_source[source_ids[i]]['features'],
+                claims_by_source[source_ids[j]]['features']
+            )
+        ]
         
-        for i in range(len(source_ids)):
-            for j in range(i + 1, len(source_ids)):
-                source_a = claims_by_source[source_ids[i]]
-                source_b = claims_by_source[source_ids[j]]
-                
-                conflict = self._compare_claims(
-                    source_a['claims'],
-                    source_b['claims'],
-                    source_a['source'],
-                    source_b['source']
-                )
-                
-                if conflict:
-                    conflicts.append(conflict)
+        if not candidate_pairs:
+            return None
+        
+        # Embed the candidates' claims once in a single batch; each source owns a contiguous block of rows.
+        # Unit-length rows make a plain dot product the cosine similarity.
+        all_claims = []
+        for source_id in dict.fromkeys(source_id for pair in candidate_pairs for source_id in pair):
+            entry = claims_by_source[source_id]
+            start = len(all_claims)
+            all_claims.extend(entry['claims'])
+            entry['rows'] = slice(start, len(all_claims))
+        embeddings = self._embed_claims(all_claims)
+        
+        # All claim-to-claim similarities in one matrix product; each source pair reads its block
+        similarities = embeddings @ embeddings.T
+        
+        # Pairwise comparison
+        conflicts = []
+        for id_a, id_b in candidate_pairs:
+            source_a = claims_by_source[id_a]
+            source_b = claims_by_source[id_b]
+            
+            conflict = self._compare_claims(
+                source_a['claims'],
+                source_b['claims'],
+                similarities[source_a['rows'], source_b['rows']],
+                source_a['source'],
+                source_b['source']
+            )
+            
+            if conflict:
+                conflicts.append(conflict)
         
         if conflicts:
             # Build ConflictInfo
@@ -109,39 +149,68 @@ class ConflictDetector:
     
     def _extract_claims(self, text: str) -> List[str]:
         """Extract factual claims from text (simplified)."""
-        # Split into sentences
-        sentences = re.split(r'[.!?]+', text)
-        
+        # Walk sentences lazily, stopping once enough claims are found
         # Filter for factual claims (sentences with verbs, nouns)
         claims = []
-        for sentence in sentences:
-            sentence = sentence.strip()
-            # Basic heuristic: must be longer than 2 words
-            if len(sentence.split()) > 2:
+        for match in _SENTENCE_RE.finditer(text):
+            sentence = match.group().strip()
+            # Basic heuristic: must be longer than 2 words (no need to split past the third)
+            if len(sentence.split(maxsplit=2)) > 2:
                 claims.append(sentence)
+                if len(claims) == 3:  # Limit to top 3 claims per source
+                    break
+        
+        return claims
+    
+    def _embed_claims(self, claims: List[str]) -> np.ndarray:
+        """Unit-length embeddings for claims, embedding only those not seen recently."""
+        found = {}
+        with self._cache_lock:
+            for claim in claims:
+                vector = self._embedding_cache.pop(claim, None)
+                if vector is not None:
+                    # Re-insert so the dict order keeps the most recently used last
+                    self._embedding_cache[claim] = vector
+                    found[claim] = vector
         
-        return claims[:3]  #Limit to top 3 claims per source
+        missing = [claim for claim in dict.fromkeys(claims) if claim not in found]
+        if missing:
+            vectors = self.embedder.embed(missing, normalize=True)
+            with self._cache_lock:
+                for claim, vector in zip(missing, vectors):
+                    found[claim] = vector
+                    self._embedding_cache[claim] = vector
+                while len(self._embedding_cache) > self.EMBEDDING_CACHE_SIZE:
+                    del self._embedding_cache[next(iter(self._embedding_cache))]
+        
+        return np.stack([found[claim] for claim in claims])
+    
+    def _claim_features(self, claim: str) -> tuple:
+        """Negation flag and number set of a claim, as used by the conflict rules."""
+        return self._negation_re.search(claim) is not None, frozenset(_NUMBER_RE.findall(claim))
+    
+    @staticmethod
+    def _may_conflict(features_a: List[tuple], features_b: List[tuple]) -> bool:
+        """Whether any claim pair could meet a conflict rule (negation mismatch or different numbers)."""
+        for negated_a, numbers_a in features_a:
+            for negated_b, numbers_b in features_b:
+                if negated_a != negated_b or (numbers_a and numbers_b and numbers_a != numbers_b):
+                    return True
+        return False
     
     def _compare_claims(
         self,
         claims_a: List[str],
         claims_b: List[str],
+        similarities: np.ndarray,
         source_a: EvidenceSource,
         source_b: EvidenceSource
     ) -> Optional[Dict]:
-        """Compare claims between two sources."""
+        """Compare claims between two sources, given their claims' cosine similarity block."""
         if not claims_a or not claims_b:
             return None
         
-        # Embed all claims
-        all_claims = claims_a + claims_b
-        embeddings = self.embedder.embed(all_claims)
-        
-        embeddings_a = embeddings[:len(claims_a)]
-        embeddings_b = embeddings[len(claims_a):]
-        
         # Find most similar pair
-        similarities = cosine_similarity(embeddings_a, embeddings_b)
         max_sim_idx = np.unravel_index(similarities.argmax(), similarities.shape)
         max_similarity = similarities[max_sim_idx]
         
@@ -150,8 +219,8 @@ class ConflictDetector:
         
         # Check for semantic similarity but textual negation
         # High similarity (same topic) + negation pattern = conflict
-        has_negation_a = any(re.search(pat, claim_a, re.IGNORECASE) for pat in self.negation_patterns)
-        has_negation_b = any(re.search(pat, claim_b, re.IGNORECASE) for pat in self.negation_patterns)
+        has_negation_a = self._negation_re.search(claim_a) is not None
+        has_negation_b = self._negation_re.search(claim_b) is not None
         
         # Conflict conditions:
         # 1. Similar topic (similarity > 0.6) but one has negation
@@ -179,8 +248,8 @@ class ConflictDetector:
     def _has_contradictory_numbers(self, text_a: str, text_b: str) -> bool:
         """Check if texts contain different numbers for same concept."""
         # Extract numbers
-        numbers_a = re.findall(r'\d+(?:\.\d+)?', text_a)
-        numbers_b = re.findall(r'\d+(?:\.\d+)?', text_b)
+        numbers_a = _NUMBER_RE.findall(text_a)
+        numbers_b = _NUMBER_RE.findall(text_b)
         
         if numbers_a and numbers_b:
             # If both have numbers and they're different, might be conflict
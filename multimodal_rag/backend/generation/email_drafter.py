@@ -101,6 +101,59 @@ class EmailDrafter:
         "confident": "Use confident, assertive language. Be clear and decisive."
     }
     
+    # Document-specific format instructions, keyed by document type
+    FORMAT_INSTRUCTIONS = {
+        "email": """
+Generate a professional email with:
+- Subject line (on its own line, starting with "Subject:")
+- Appropriate greeting
+- Clear body paragraphs
+- Professional closing
+- Signature placeholder [Name]
+
+Include source references in parentheses where relevant, e.g., (ref: document.pdf, page 5)
+""",
+        "report": """
+Generate a formal report with:
+- Title (on its own line, starting with "Title:")
+- Executive Summary section
+- Key Findings (with numbered points)
+- Recommendations
+- Conclusion
+
+Include source citations where relevant, e.g., (Source: document.pdf, page 5)
+""",
+        "memo": """
+Generate a professional memo with:
+- TO: [Recipient]
+- FROM: [Sender]
+- DATE: [Current Date]
+- RE: [Subject]
+- Body with clear sections
+
+Include source references where relevant.
+""",
+        "summary": """
+Generate a concise summary with:
+- Key Points (bulleted list)
+- Brief overview paragraph
+- Action items if applicable
+
+Include source references where relevant.
+""",
+        "letter": """
+Generate a formal letter with:
+- Date
+- Recipient address placeholder
+- Greeting
+- Body paragraphs
+- Closing
+- Signature
+
+Include source references where relevant.
+"""
+    }
+    
     def __init__(self, retriever: CrossModalRetriever):
         self.retriever = retriever
         self.llm_client = LLMClient()
@@ -234,60 +287,10 @@ class EmailDrafter:
         evidence_text = "\n\n".join(evidence_parts) if evidence_parts else "No specific evidence available."
         
         # Determine document-specific instructions
-        if request.document_type == DocumentType.EMAIL:
-            format_instructions = """
-Generate a professional email with:
-- Subject line (on its own line, starting with "Subject:")
-- Appropriate greeting
-- Clear body paragraphs
-- Professional closing
-- Signature placeholder [Name]
-
-Include source references in parentheses where relevant, e.g., (ref: document.pdf, page 5)
-"""
-        elif request.document_type == DocumentType.REPORT:
-            format_instructions = """
-Generate a formal report with:
-- Title (on its own line, starting with "Title:")
-- Executive Summary section
-- Key Findings (with numbered points)
-- Recommendations
-- Conclusion
-
-Include source citations where relevant, e.g., (Source: document.pdf, page 5)
-"""
-        elif request.document_type == DocumentType.MEMO:
-            format_instructions = """
-Generate a professional memo with:
-- TO: [Recipient]
-- FROM: [Sender]
-- DATE: [Current Date]
-- RE: [Subject]
-- Body with clear sections
-
-Include source references where relevant.
-"""
-        elif request.document_type == DocumentType.SUMMARY:
-            format_instructions = """
-Generate a concise summary with:
-- Key Points (bulleted list)
-- Brief overview paragraph
-- Action items if applicable
-
-Include source references where relevant.
-"""
-        else:  # LETTER
-            format_instructions = """
-Generate a formal letter with:
-- Date
-- Recipient address placeholder
-- Greeting
-- Body paragraphs
-- Closing
-- Signature
-
-Include source references where relevant.
-"""
+        format_instructions = self.FORMAT_INSTRUCTIONS.get(
+            request.document_type.value,
+            self.FORMAT_INSTRUCTIONS["letter"]
+        )
         
         # Build recipient info
         recipient_info = ""
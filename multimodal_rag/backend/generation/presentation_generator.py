@@ -120,6 +120,27 @@ THEME_COLORS = {
 }
 
 
+# Theme picker entries for the UI; swatch colors come from THEME_COLORS (primary, accent)
+_THEME_LABELS = {
+    "professional": ("Professional", "💼", "Classic dark blue with orange accents"),
+    "modern": ("Modern", "🎨", "Purple and teal gradient style"),
+    "minimal": ("Minimal", "⬜", "Clean grayscale with blue accents"),
+    "corporate": ("Corporate", "🏢", "Traditional corporate blue and gold"),
+    "creative": ("Creative", "✨", "Vibrant pink and teal"),
+}
+
+PRESENTATION_THEMES = [
+    {
+        "value": theme,
+        "name": name,
+        "icon": icon,
+        "description": description,
+        "colors": [f"#{THEME_COLORS[theme]['primary']}", f"#{THEME_COLORS[theme]['accent']}"]
+    }
+    for theme, (name, icon, description) in _THEME_LABELS.items()
+]
+
+
 class PresentationGenerator:
     """Automated PowerPoint presentation generator using RAG context."""
     
@@ -80,6 +80,13 @@ class RAGGenerator:
         self.conflict_detector = ConflictDetector()
         self.llm_client = LLMClient()
     
+    def warmup(self):
+        """Load the conflict detector's embedding model ahead of the first query."""
+        try:
+            self.conflict_detector.embedder.embed(["warmup"])
+        except Exception as e:
+            logger.logger.warning(f"RAG generator warmup failed: {e}")
+    
     def _create_source_references(self, sources: List[EvidenceSource]) -> List[SourceReference]:
         """Create source references for reasoning chain."""
         return [
@@ -378,7 +385,8 @@ class RAGGenerator:
         step_num += 1
         step_start = time.time()
         
-        conflicts = self.conflict_detector.detect_conflicts(sources)
+        # Claim embedding runs the sentence encoder - keep it off the event loop
+        conflicts = await asyncio.to_thread(self.conflict_detector.detect_conflicts, sources)
         
         conflict_status = "completed"
         conflict_details = {"conflicts_found": False}
@@ -0,0 +1,37 @@
+"""Process-pool entry points for CPU-bound media processing."""
+from pathlib import Path
+from typing import List
+
+from backend.models.document import DocumentChunk
+
+# Per-worker processors, created once by init_worker so models load once per process
+_text_processor = None
+_image_processor = None
+_audio_processor = None
+
+
+def init_worker():
+    """Create the media processors inside a pool worker process."""
+    global _text_processor, _image_processor, _audio_processor
+    from backend.ingestion.text_processor import TextProcessor
+    from backend.ingestion.image_processor import ImageProcessor
+    from backend.ingestion.audio_processor import AudioProcessor
+
+    _text_processor = TextProcessor()
+    _image_processor = ImageProcessor()
+    _audio_processor = AudioProcessor()
+
+
+def process_text(file_path: Path) -> List[DocumentChunk]:
+    """Parse and chunk a PDF/DOCX/TXT document (OCR included for scanned PDFs) in this worker."""
+    return _text_processor.process_file(file_path)
+
+
+def process_image(file_path: Path) -> List[DocumentChunk]:
+    """Run OCR/feature extraction for an image in this worker."""
+    return _image_processor.process_file(file_path)
+
+
+def process_audio(file_path: Path) -> List[DocumentChunk]:
+    """Run transcription for an audio/video file in this worker."""
+    return _audio_processor.process_file(file_path)
@@ -19,7 +19,7 @@ class DocumentChunk(BaseModel):
     modality: Modality
     content: str
     metadata: Dict[str, Any] = Field(default_factory=dict)
-    embedding: Optional[List[float]] = None
+    embedding: Optional[Any] = None  # List[float] or a float32 numpy row
     confidence: float = 1.0
     timestamp: datetime = Field(default_factory=datetime.now)
     cross_refs: List[str] = Field(default_factory=list)
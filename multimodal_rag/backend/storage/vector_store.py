@@ -1,6 +1,7 @@
 """Vector store using ChromaDB for multimodal embeddings."""
 from typing import List, Dict, Any, Optional
 import chromadb
+import numpy as np
 from chromadb.config import Settings as ChromaSettings
 
 from backend.models.document import DocumentChunk, Modality
@@ -44,7 +45,11 @@ class VectorStore:
         
         # Prepare data for ChromaDB
         ids = [chunk.chunk_id for chunk in valid_chunks]
-        embeddings = [chunk.embedding for chunk in valid_chunks]
+        # Chroma 0.4 only accepts plain lists, so numpy rows are converted once, here
+        embeddings = [
+            chunk.embedding.tolist() if isinstance(chunk.embedding, np.ndarray) else chunk.embedding
+            for chunk in valid_chunks
+        ]
         documents = [chunk.content for chunk in valid_chunks]
         metadatas = [
             {
@@ -127,6 +132,18 @@ class VectorStore:
             logger.logger.error(f"Failed to get all chunks: {e}")
             return {"ids": [], "documents": [], "metadatas": []}
     
+    def get_page(self, offset: int, limit: int) -> Dict[str, Any]:
+        """Retrieve one page of chunks (documents + metadata, no embeddings) for full scans.
+
+        Errors are raised rather than returned as an empty page, so a failed read
+        can't be mistaken for the end of the collection.
+        """
+        return self.collection.get(
+            include=["documents", "metadatas"],
+            limit=limit,
+            offset=offset
+        )
+    
     def count(self) -> int:
         """Get total number of chunks in the store."""
         try:
@@ -68,10 +68,15 @@ class DocumentWatcher(FileSystemEventHandler):
         return ext in self.SUPPORTED_EXTENSIONS
     
     def _compute_file_hash(self, path: str) -> Optional[str]:
-        """Compute MD5 hash of a file for change detection."""
+        """Compute SHA-256 hash of a file for change detection."""
         try:
             with open(path, 'rb') as f:
-                return hashlib.md5(f.read()).hexdigest()
+                if hasattr(hashlib, "file_digest"):  # Python 3.11+
+                    return hashlib.file_digest(f, "sha256").hexdigest()
+                digest = hashlib.sha256()
+                for block in iter(lambda: f.read(1024 * 1024), b""):
+                    digest.update(block)
+                return digest.hexdigest()
         except Exception:
             return None
     
@@ -342,7 +342,41 @@ async function handleFiles(files) {
     for (let file of files) {
         await uploadFile(file);
     }
-    updateStats();
+}
+
+// Uploads accepted for background indexing, keyed by doc_id until their completion event arrives
+const pendingUploads = new Map();
+let uploadPollingInterval = null;
+
+function trackPendingUpload(docId, fileName) {
+    pendingUploads.set(docId, fileName);
+    // Completion events are delivered through /sync/changes; poll it while uploads are pending
+    if (!uploadPollingInterval) {
+        uploadPollingInterval = setInterval(pollForChanges, 1000);
+    }
+}
+
+// Handle an upload's file_indexed / file_index_failed event; returns true if it was one
+function handleUploadEvent(change) {
+    if (change.type !== 'file_indexed' && change.type !== 'file_index_failed') return false;
+
+    const fileName = pendingUploads.get(change.doc_id) || change.file_name;
+    pendingUploads.delete(change.doc_id);
+    if (pendingUploads.size === 0 && uploadPollingInterval) {
+        clearInterval(uploadPollingInterval);
+        uploadPollingInterval = null;
+    }
+
+    if (change.type === 'file_indexed') {
+        uploadStatus.textContent = `✓ ${fileName} indexed - ${change.chunks_created} chunks created`;
+        uploadStatus.className = 'upload-status success';
+        updateStats();
+    } else {
+        uploadStatus.textContent = `✗ Error processing ${fileName}: ${change.error}`;
+        uploadStatus.className = 'upload-status error';
+        showToast('❌ Indexing Failed', `${fileName}: ${change.error}`, 'error');
+    }
+    return true;
 }
 
 async function uploadFile(file) {
@@ -360,9 +394,15 @@ async function uploadFile(file) {
 
         const data = await response.json();
 
-        if (response.ok) {
+        if (response.status === 202) {
+            // Processing continues in the background; completion arrives via sync notifications
+            uploadStatus.textContent = `⏳ ${data.message}`;
+            uploadStatus.className = 'upload-status';
+            trackPendingUpload(data.doc_id, file.name);
+        } else if (response.ok) {
             uploadStatus.textContent = `✓ ${data.message} - ${data.chunks_created} chunks created`;
             uploadStatus.className = 'upload-status success';
+            updateStats();
         } else {
             uploadStatus.textContent = `✗ Error: ${data.detail}`;
             uploadStatus.className = 'upload-status error';
@@ -2500,7 +2540,9 @@ async function pollForChanges() {
         if (data.changes && data.changes.length > 0) {
             console.log('Got sync changes:', data.changes);
             for (const change of data.changes) {
-                addSyncNotification(change);
+                if (!handleUploadEvent(change)) {
+                    addSyncNotification(change);
+                }
             }
         }
     } catch (error) {
@@ -10,7 +10,7 @@ print("FFmpeg initialized.")
 if __name__ == "__main__":
     print("Starting Uvicorn server...")
     try:
-        uvicorn.run("backend.app:app", host="0.0.0.0", port=8000, reload=False)
+        uvicorn.run("backend.app:app", host="0.0.0.0", port=8000, reload=False, ws_per_message_deflate=True)
     except Exception as e:
         print(f"Server crashed: {e}")
         import traceback